@@ -8,13 +8,17 @@ This script runs the visualization process for wildfire PM2.5 data and solar pot
 It uses the functions from wildfire_pm25_visualization.py to create publication-quality figures.
 
 Usage:
-    python run_visualization.py [output_dir]
+    python run_visualization.py [-v] [output_dir]
 
-    If output_dir is not provided, figures will be saved to ./figures
+    If output_dir is not provided, figures will be saved to ./figures.
+    With -v/--verbose, processing progress and summary statistics are logged.
 """
 
+import logging
+import multiprocessing
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
 import xarray as xr
@@ -25,12 +29,86 @@ import wildfire_pm25_visualization as viz
 # Default output directory for saving figures
 DEFAULT_OUTPUT_DIR = './figures'
 
-def main(out_dir=DEFAULT_OUTPUT_DIR):
+# Rendering backend for the individual maps (falls back to matplotlib when
+# datashader is not installed)
+MAP_BACKEND = 'datashader'
+
+# Individual PM2.5 concentration maps: (variable, title, filename)
+PM25_MAPS = [
+    ("wildfire_pm25_2000", "Wildfire PM2.5 Concentration (2000 Baseline)", "wildfire_pm25_2000.png"),
+    ("wildfire_pm25_2050_45", "Wildfire PM2.5 Concentration (2050 RCP 4.5)", "wildfire_pm25_2050_rcp45.png"),
+    ("wildfire_pm25_2050_85", "Wildfire PM2.5 Concentration (2050 RCP 8.5)", "wildfire_pm25_2050_rcp85.png"),
+    ("wildfire_pm25_2100_45", "Wildfire PM2.5 Concentration (2100 RCP 4.5)", "wildfire_pm25_2100_rcp45.png"),
+    ("wildfire_pm25_2100_85", "Wildfire PM2.5 Concentration (2100 RCP 8.5)", "wildfire_pm25_2100_rcp85.png")
+]
+
+# Individual solar potential change maps: (variable, title, filename)
+SOLAR_MAPS = [
+    ("solar_change_2000", "Solar Potential Loss Due to Wildfire PM2.5 (2000 Baseline)", "solar_potential_loss_2000.png"),
+    ("solar_change_2050_45", "Solar Potential Loss Due to Wildfire PM2.5 (2050 RCP 4.5)", "solar_potential_loss_2050_rcp45.png"),
+    ("solar_change_2050_85", "Solar Potential Loss Due to Wildfire PM2.5 (2050 RCP 8.5)", "solar_potential_loss_2050_rcp85.png"),
+    ("solar_change_2100_45", "Solar Potential Loss Due to Wildfire PM2.5 (2100 RCP 4.5)", "solar_potential_loss_2100_rcp45.png"),
+    ("solar_change_2100_85", "Solar Potential Loss Due to Wildfire PM2.5 (2100 RCP 8.5)", "solar_potential_loss_2100_rcp85.png")
+]
+
+# Panels of the scenario comparison figures: (panel title, variable)
+PM25_SCENARIOS = [
+    ("2000 Baseline", "wildfire_pm25_2000"),
+    ("2050 RCP 4.5", "wildfire_pm25_2050_45"),
+    ("2050 RCP 8.5", "wildfire_pm25_2050_85"),
+    ("2100 RCP 4.5", "wildfire_pm25_2100_45"),
+    ("2100 RCP 8.5", "wildfire_pm25_2100_85")
+]
+
+PM25_CHANGES = [
+    ("2000 to 2050 (RCP 4.5)", "change_2000_to_2050_45"),
+    ("2000 to 2050 (RCP 8.5)", "change_2000_to_2050_85"),
+    ("2050 to 2100 (RCP 4.5)", "change_2050_to_2100_45"),
+    ("2050 to 2100 (RCP 8.5)", "change_2050_to_2100_85")
+]
+
+SOLAR_SCENARIOS = [
+    ("2000 Baseline", "solar_change_2000"),
+    ("2050 RCP 4.5", "solar_change_2050_45"),
+    ("2050 RCP 8.5", "solar_change_2050_85"),
+    ("2100 RCP 4.5", "solar_change_2100_45"),
+    ("2100 RCP 8.5", "solar_change_2100_85")
+]
+
+SOLAR_CHANGES = [
+    ("2000 to 2050 (RCP 4.5)", "solar_diff_2000_to_2050_45"),
+    ("2000 to 2050 (RCP 8.5)", "solar_diff_2000_to_2050_85"),
+    ("2050 to 2100 (RCP 4.5)", "solar_diff_2050_to_2100_45"),
+    ("2050 to 2100 (RCP 8.5)", "solar_diff_2050_to_2100_85")
+]
+
+def _init_worker(out_dir):
+    """
+    Set up the visualization environment once in each worker process.
+    
+    Parameters:
+        out_dir (str): Directory to save figures
+    """
+    viz.set_output_directory(out_dir)
+
+def _render_one(job):
+    """
+    Render a single figure. Runs in a worker process.
+    
+    Parameters:
+        job (tuple): (function name in wildfire_pm25_visualization, args, kwargs)
+    """
+    func_name, args, kwargs = job
+    getattr(viz, func_name)(*args, **kwargs)
+
+def main(out_dir=DEFAULT_OUTPUT_DIR, max_workers=None):
     """
     Main function to run the visualization process.
     
     Parameters:
         out_dir (str): Directory to save figures
+        max_workers (int, optional): Number of worker processes used to render
+            figures (defaults to the number of CPUs, capped at the number of figures)
     
     Returns:
         int: Exit code (0 for success, 1 for error)
@@ -42,201 +120,81 @@ def main(out_dir=DEFAULT_OUTPUT_DIR):
     print(f"Figures will be saved to: {os.path.abspath(output_dir)}")
     
     try:
-        # Process data using wildfire_pm25_processing.py
-        print("\nProcessing PM2.5 data...")
-        processed_data = wpp.main()
-        
-        # Extract key datasets for visualization
+        # Load cached results, or process data using wildfire_pm25_processing.py
+        processed_data = wpp.load_cached_results()
+        if processed_data is not None:
+            print(f"\nLoaded processed PM2.5 data from {wpp.CACHE_PATH}")
+        else:
+            print("\nProcessing PM2.5 data...")
+            processed_data = wpp.main()
+        
+        # Load the datasets needed for visualization into memory in a single
+        # pass, so worker processes receive plain arrays rather than dask graphs
         print("\nExtracting key datasets for visualization...")
+        names = [name for table in (PM25_MAPS, SOLAR_MAPS) for name, _, _ in table]
+        names += [name for table in (PM25_CHANGES, SOLAR_CHANGES) for _, name in table]
+        data = xr.Dataset({name: processed_data[name] for name in names}).load()
         
-        # PM2.5 concentration datasets
-        wildfire_pm25_2000 = processed_data["wildfire_pm25_2000"]
-        wildfire_pm25_2050_45 = processed_data["wildfire_pm25_2050_45"]
-        wildfire_pm25_2050_85 = processed_data["wildfire_pm25_2050_85"]
-        wildfire_pm25_2100_45 = processed_data["wildfire_pm25_2100_45"]
-        wildfire_pm25_2100_85 = processed_data["wildfire_pm25_2100_85"]
-        
-        # PM2.5 change datasets
-        change_2000_to_2050_45 = processed_data["change_2000_to_2050_45"]
-        change_2000_to_2050_85 = processed_data["change_2000_to_2050_85"]
-        change_2050_to_2100_45 = processed_data["change_2050_to_2100_45"]
-        change_2050_to_2100_85 = processed_data["change_2050_to_2100_85"]
-        change_2000_to_2100_45 = processed_data["change_2000_to_2100_45"]
-        change_2000_to_2100_85 = processed_data["change_2000_to_2100_85"]
-        
-        # Solar potential change datasets
-        solar_change_2000 = processed_data["solar_change_2000"]
-        solar_change_2050_45 = processed_data["solar_change_2050_45"]
-        solar_change_2050_85 = processed_data["solar_change_2050_85"]
-        solar_change_2100_45 = processed_data["solar_change_2100_45"]
-        solar_change_2100_85 = processed_data["solar_change_2100_85"]
-        
-        # Solar potential change over time datasets
-        solar_diff_2000_to_2050_45 = processed_data["solar_diff_2000_to_2050_45"]
-        solar_diff_2000_to_2050_85 = processed_data["solar_diff_2000_to_2050_85"]
-        solar_diff_2050_to_2100_45 = processed_data["solar_diff_2050_to_2100_45"]
-        solar_diff_2050_to_2100_85 = processed_data["solar_diff_2050_to_2100_85"]
-        solar_diff_2000_to_2100_45 = processed_data["solar_diff_2000_to_2100_45"]
-        solar_diff_2000_to_2100_85 = processed_data["solar_diff_2000_to_2100_85"]
-        
-        # Generate visualizations
-        print("\nGenerating visualizations...")
-        
-        # 1. Create PM2.5 concentration maps
-        print("\n1. Creating PM2.5 concentration maps...")
+        pm25_scenario_dict = {panel: data[name] for panel, name in PM25_SCENARIOS}
+        pm25_changes_dict = {panel: data[name] for panel, name in PM25_CHANGES}
+        solar_scenario_dict = {panel: data[name] for panel, name in SOLAR_SCENARIOS}
+        solar_changes_dict = {panel: data[name] for panel, name in SOLAR_CHANGES}
         
-        # Individual PM2.5 maps
-        viz.create_pm25_map(
-            wildfire_pm25_2000,
-            "Wildfire PM2.5 Concentration (2000 Baseline)",
-            "wildfire_pm25_2000.png"
-        )
-        
-        viz.create_pm25_map(
-            wildfire_pm25_2050_45,
-            "Wildfire PM2.5 Concentration (2050 RCP 4.5)",
-            "wildfire_pm25_2050_rcp45.png"
-        )
-        
-        viz.create_pm25_map(
-            wildfire_pm25_2050_85,
-            "Wildfire PM2.5 Concentration (2050 RCP 8.5)",
-            "wildfire_pm25_2050_rcp85.png"
-        )
-        
-        viz.create_pm25_map(
-            wildfire_pm25_2100_45,
-            "Wildfire PM2.5 Concentration (2100 RCP 4.5)",
-            "wildfire_pm25_2100_rcp45.png"
-        )
-        
-        viz.create_pm25_map(
-            wildfire_pm25_2100_85,
-            "Wildfire PM2.5 Concentration (2100 RCP 8.5)",
-            "wildfire_pm25_2100_rcp85.png"
-        )
-        
-        # PM2.5 scenario comparison
-        pm25_scenario_dict = {
-            "2000 Baseline": wildfire_pm25_2000,
-            "2050 RCP 4.5": wildfire_pm25_2050_45,
-            "2050 RCP 8.5": wildfire_pm25_2050_85,
-            "2100 RCP 4.5": wildfire_pm25_2100_45,
-            "2100 RCP 8.5": wildfire_pm25_2100_85
-        }
-        
-        viz.create_scenario_comparison_map(
-            pm25_scenario_dict,
-            "Wildfire PM2.5 Concentration Across Scenarios",
-            "wildfire_pm25_scenario_comparison.png",
-            cmap="YlOrBr"
-        )
-        
-        # PM2.5 changes over time
-        pm25_changes_dict = {
-            "2000 to 2050 (RCP 4.5)": change_2000_to_2050_45,
-            "2000 to 2050 (RCP 8.5)": change_2000_to_2050_85,
-            "2050 to 2100 (RCP 4.5)": change_2050_to_2100_45,
-            "2050 to 2100 (RCP 8.5)": change_2050_to_2100_85
-        }
-        
-        viz.create_scenario_comparison_map(
-            pm25_changes_dict,
-            "Changes in Wildfire PM2.5 Concentration Over Time",
-            "wildfire_pm25_changes.png"
-        )
-        
-        # 2. Create solar potential change maps
-        print("\n2. Creating solar potential change maps...")
-        
-        # Individual solar potential maps
-        viz.create_solar_potential_map(
-            solar_change_2000,
-            "Solar Potential Loss Due to Wildfire PM2.5 (2000 Baseline)",
-            "solar_potential_loss_2000.png",
-            cmap="Reds_r"
-        )
-        
-        viz.create_solar_potential_map(
-            solar_change_2050_45,
-            "Solar Potential Loss Due to Wildfire PM2.5 (2050 RCP 4.5)",
-            "solar_potential_loss_2050_rcp45.png",
-            cmap="Reds_r"
-        )
-        
-        viz.create_solar_potential_map(
-            solar_change_2050_85,
-            "Solar Potential Loss Due to Wildfire PM2.5 (2050 RCP 8.5)",
-            "solar_potential_loss_2050_rcp85.png",
-            cmap="Reds_r"
-        )
-        
-        viz.create_solar_potential_map(
-            solar_change_2100_45,
-            "Solar Potential Loss Due to Wildfire PM2.5 (2100 RCP 4.5)",
-            "solar_potential_loss_2100_rcp45.png",
-            cmap="Reds_r"
-        )
-        
-        viz.create_solar_potential_map(
-            solar_change_2100_85,
-            "Solar Potential Loss Due to Wildfire PM2.5 (2100 RCP 8.5)",
-            "solar_potential_loss_2100_rcp85.png",
-            cmap="Reds_r"
-        )
-        
-        # Solar potential scenario comparison
-        solar_scenario_dict = {
-            "2000 Baseline": solar_change_2000,
-            "2050 RCP 4.5": solar_change_2050_45,
-            "2050 RCP 8.5": solar_change_2050_85,
-            "2100 RCP 4.5": solar_change_2100_45,
-            "2100 RCP 8.5": solar_change_2100_85
-        }
-        
-        viz.create_scenario_comparison_map(
-            solar_scenario_dict,
-            "Solar Potential Loss Due to Wildfire PM2.5 Across Scenarios",
-            "solar_potential_loss_scenario_comparison.png",
-            cmap="Reds_r"
-        )
-        
-        # Solar potential changes over time
-        solar_changes_dict = {
-            "2000 to 2050 (RCP 4.5)": solar_diff_2000_to_2050_45,
-            "2000 to 2050 (RCP 8.5)": solar_diff_2000_to_2050_85,
-            "2050 to 2100 (RCP 4.5)": solar_diff_2050_to_2100_45,
-            "2050 to 2100 (RCP 8.5)": solar_diff_2050_to_2100_85
-        }
-        
-        viz.create_scenario_comparison_map(
-            solar_changes_dict,
-            "Changes in Solar Potential Loss Over Time",
-            "solar_potential_loss_changes.png"
-        )
-        
-        # 3. Create regional analysis visualizations
-        print("\n3. Creating regional analysis visualizations...")
-        
-        # Calculate regional means for solar potential loss
+        # Calculate regional means for solar potential loss and its changes
+        print("\nCalculating regional means...")
         solar_regional_means = viz.calculate_regional_means(solar_scenario_dict)
-        
-        # Create regional bar chart for solar potential loss
-        viz.create_regional_bar_chart(
-            solar_regional_means,
-            "Regional Solar Potential Loss Due to Wildfire PM2.5",
-            "regional_solar_potential_loss.png"
-        )
-        
-        # Calculate regional means for changes in solar potential
         solar_changes_regional_means = viz.calculate_regional_means(solar_changes_dict)
         
-        # Create regional bar chart for changes in solar potential
-        viz.create_regional_bar_chart(
-            solar_changes_regional_means,
-            "Regional Changes in Solar Potential Loss Over Time",
-            "regional_solar_potential_loss_changes.png"
-        )
+        # Build the list of figures to render
+        jobs = []
+        
+        # 1. PM2.5 concentration maps
+        for name, title, filename in PM25_MAPS:
+            jobs.append(("create_pm25_map", (data[name], title, filename), {"backend": MAP_BACKEND}))
+        jobs.append(("create_scenario_comparison_map",
+                     (pm25_scenario_dict, "Wildfire PM2.5 Concentration Across Scenarios",
+                      "wildfire_pm25_scenario_comparison.png"),
+                     {"cmap": "YlOrBr"}))
+        jobs.append(("create_scenario_comparison_map",
+                     (pm25_changes_dict, "Changes in Wildfire PM2.5 Concentration Over Time",
+                      "wildfire_pm25_changes.png"),
+                     {}))
+        
+        # 2. Solar potential change maps
+        for name, title, filename in SOLAR_MAPS:
+            jobs.append(("create_solar_potential_map", (data[name], title, filename),
+                         {"cmap": "Reds_r", "backend": MAP_BACKEND}))
+        jobs.append(("create_scenario_comparison_map",
+                     (solar_scenario_dict, "Solar Potential Loss Due to Wildfire PM2.5 Across Scenarios",
+                      "solar_potential_loss_scenario_comparison.png"),
+                     {"cmap": "Reds_r"}))
+        jobs.append(("create_scenario_comparison_map",
+                     (solar_changes_dict, "Changes in Solar Potential Loss Over Time",
+                      "solar_potential_loss_changes.png"),
+                     {}))
+        
+        # 3. Regional analysis visualizations
+        jobs.append(("create_regional_bar_chart",
+                     (solar_regional_means, "Regional Solar Potential Loss Due to Wildfire PM2.5",
+                      "regional_solar_potential_loss.png"),
+                     {}))
+        jobs.append(("create_regional_bar_chart",
+                     (solar_changes_regional_means, "Regional Changes in Solar Potential Loss Over Time",
+                      "regional_solar_potential_loss_changes.png"),
+                     {}))
+        
+        # Generate visualizations; every figure is independent, so render them
+        # in parallel worker processes (matplotlib itself is not thread-safe)
+        max_workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+        print(f"\nGenerating {len(jobs)} visualizations with {max_workers} worker processes...")
+        # Workers are spawned rather than forked: by now this process has run
+        # dask's threaded scheduler, and forking a multi-threaded process can
+        # deadlock
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker,
+                                 initargs=(output_dir,)) as executor:
+            list(executor.map(_render_one, jobs))
         
         print("\nVisualization process completed successfully!")
         print(f"All figures saved to: {os.path.abspath(output_dir)}")
@@ -251,11 +209,17 @@ def main(out_dir=DEFAULT_OUTPUT_DIR):
 
 if __name__ == "__main__":
     # Parse command-line arguments
-    if len(sys.argv) > 1:
-        output_dir = sys.argv[1]
+    args = [arg for arg in sys.argv[1:] if arg not in ('-v', '--verbose')]
+    if len(args) > 0:
+        output_dir = args[0]
     else:
         output_dir = DEFAULT_OUTPUT_DIR
     
+    # Processing progress and summary statistics are only logged (and the
+    # statistics only computed) with -v/--verbose
+    verbose = len(args) < len(sys.argv) - 1
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING, format='%(message)s')
+    
     # Run the main function
     exit_code = main(output_dir)
     sys.exit(exit_code)
@@ -18,18 +18,134 @@ Steps:
 # Import required libraries
 import xarray as xr
 import numpy as np
+import pandas as pd
+import functools
+import logging
 import os
+import re
+import shutil
+import sys
 from pathlib import Path
 
+# h5netcdf is optional; it is used to read netCDF4/HDF5 files with a larger chunk cache
+try:
+    import h5netcdf
+    H5NETCDF_AVAILABLE = True
+except ImportError:
+    H5NETCDF_AVAILABLE = False
+
+# zarr is optional; it is used to cache the processed results on disk
+try:
+    import zarr
+    ZARR_AVAILABLE = True
+except ImportError:
+    ZARR_AVAILABLE = False
+
+# numba is optional; it compiles the solar potential kernels into single-pass loops
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 # Define directories for data
 data_dir = './data'
 
+# Dask chunking used when opening the CESM files: one chunk per file (all
+# monthly means on the full global grid), so every operation stays lazy until
+# the statistics are computed
+CHUNKS = {'time': -1, 'lat': -1, 'lon': -1}
+
+# HDF5 chunk cache size used when reading netCDF4/HDF5 files with h5netcdf
+H5_CHUNK_CACHE_BYTES = 256 * 1024 * 1024
+
+# Zarr store caching the results of main() between runs
+CACHE_PATH = './cache/wildfire_solar.zarr'
+
+# Signature at the start of every HDF5 (and therefore netCDF4) file
+HDF5_SIGNATURE = b'\x89HDF\r\n\x1a\n'
+
+# Solar potential change (%) per μg/m³ of PM2.5: -0.48 / 17.71 * 100
+# (float32 so that the PM2.5 arrays are never upcast to float64)
+SOLAR_SENSITIVITY = np.float32(-0.48) / np.float32(17.71) * np.float32(100.0)
+
+# Hard cap on solar potential change (complete loss of solar potential)
+SOLAR_LOSS_CAP = np.float32(-100.0)
+
+# Summary statistics logged by main(): (heading, units, [(label, variable)])
+STATISTICS_REPORT = [
+    ("Wildfire PM2.5", "μg/m³", [
+        ("2000", "wildfire_pm25_2000"),
+        ("2050 RCP 4.5", "wildfire_pm25_2050_45"),
+        ("2050 RCP 8.5", "wildfire_pm25_2050_85"),
+        ("2100 RCP 4.5", "wildfire_pm25_2100_45"),
+        ("2100 RCP 8.5", "wildfire_pm25_2100_85")
+    ]),
+    ("Change in Wildfire PM2.5", "μg/m³", [
+        ("2000 to 2050 (RCP 4.5)", "change_2000_to_2050_45"),
+        ("2050 to 2100 (RCP 4.5)", "change_2050_to_2100_45"),
+        ("2000 to 2100 (RCP 4.5)", "change_2000_to_2100_45"),
+        ("2000 to 2050 (RCP 8.5)", "change_2000_to_2050_85"),
+        ("2050 to 2100 (RCP 8.5)", "change_2050_to_2100_85"),
+        ("2000 to 2100 (RCP 8.5)", "change_2000_to_2100_85")
+    ]),
+    ("Solar Power Potential Change", "%", [
+        ("2000", "solar_change_2000"),
+        ("2050 RCP 4.5", "solar_change_2050_45"),
+        ("2050 RCP 8.5", "solar_change_2050_85"),
+        ("2100 RCP 4.5", "solar_change_2100_45"),
+        ("2100 RCP 8.5", "solar_change_2100_85")
+    ]),
+    ("Change in Solar Power Potential", "%", [
+        ("2000 to 2050 (RCP 4.5)", "solar_diff_2000_to_2050_45"),
+        ("2000 to 2050 (RCP 8.5)", "solar_diff_2000_to_2050_85"),
+        ("2050 to 2100 (RCP 4.5)", "solar_diff_2050_to_2100_45"),
+        ("2050 to 2100 (RCP 8.5)", "solar_diff_2050_to_2100_85"),
+        ("2000 to 2100 (RCP 4.5)", "solar_diff_2000_to_2100_45"),
+        ("2000 to 2100 (RCP 8.5)", "solar_diff_2000_to_2100_85")
+    ])
+]
+
+# Scenarios processed by main(), labelled as in the result variable names
+SCENARIOS = ['2000', '2050_45', '2050_85', '2100_45', '2100_85']
+
+# Pattern of the CESM PM2.5 file names, e.g. CESM_09x125_PM25_2050_RCP45_NoFire.nc
+# or CESM_09x125_PM25_2000_BaseLine_NoFire.nc
+PM25_FILE_PATTERN = re.compile(
+    r'CESM_09x125_PM25_(?P<year>\d{4})_(?:Base[Ll]ine|RCP(?P<rcp>\d{2}))(?P<nofire>_NoFire)?\.nc$')
+
 # List available data files to verify they exist
 pm25_files = [f for f in os.listdir(data_dir) if f.startswith('CESM') and f.endswith('.nc')]
 pm25_files.sort()
-print("Available PM2.5 files:", pm25_files)
+logger.info("Available PM2.5 files: %s", pm25_files)
 
 # Utility Functions
+@functools.lru_cache(maxsize=8)
+def _fixed_lon(lon_bytes, dtype):
+    """Compute the (-180, 180) longitudes of a grid and the roll that orders them.
+    
+    Cached on the raw coordinate values, so every array on the same grid gets
+    the very same coordinate array and alignment between them is trivial.
+    
+    Parameters:
+        lon_bytes (bytes): Raw longitude values
+        dtype (str): NumPy dtype of the longitude values
+    
+    Returns:
+        tuple: (new_lon, shift) - read-only rolled longitudes and the roll to
+            apply to the data
+    """
+    lon = np.frombuffer(lon_bytes, dtype=dtype)
+    
+    # For a monotonic 0-360 grid the wrapped values all sit at the end, so
+    # sorting reduces to a cyclic roll that moves them to the front
+    shift = int((lon > 180).sum())
+    new_lon = np.roll(np.where(lon > 180, lon - 360, lon).astype(lon.dtype), shift)
+    new_lon.flags.writeable = False
+    return new_lon, shift
+
 def fix_lon(ds):
     """Adjust longitude values to ensure they are within (-180, 180) range.
     
@@ -41,71 +157,172 @@ def fix_lon(ds):
     """
     lon_name = 'lon'  # whatever name is in the data
 
-    # Make a copy to avoid modifying the original
-    ds_copy = ds.copy()
-    
-    # Adjust lon values to make sure they are within (-180, 180)
-    ds_copy['_longitude_adjusted'] = xr.where(
-        ds_copy[lon_name] > 180,
-        ds_copy[lon_name] - 360,
-        ds_copy[lon_name])
+    # Adjust lon values to make sure they are within (-180, 180); the adjusted
+    # coordinate is computed once per grid and shared by all arrays on it
+    lon = np.ascontiguousarray(ds[lon_name].values)
+    new_lon, shift = _fixed_lon(lon.tobytes(), lon.dtype.str)
 
-    # reassign the new coords to as the main lon coords
-    # and sort DataArray using new coordinate values
-    ds_copy = (
-        ds_copy
-        .swap_dims({lon_name: '_longitude_adjusted'})
-        .sortby('_longitude_adjusted')  # Use sortby instead of sel with sorted
-        .drop_vars(lon_name))
+    # Roll the data (lazily for dask-backed arrays) to match the coordinate
+    ds_fixed = ds.roll({lon_name: shift}, roll_coords=False) if shift else ds
+    ds_fixed = ds_fixed.assign_coords({lon_name: new_lon})
 
-    ds_copy = ds_copy.rename({'_longitude_adjusted': lon_name})
-    return ds_copy
+    # Fall back to a full sort for grids that were not monotonic to begin with
+    if not ds_fixed.indexes[lon_name].is_monotonic_increasing:
+        ds_fixed = ds_fixed.sortby(lon_name)
 
-# Function to process a specific year and scenario
-def process_scenario_data(year, scenario):
-    """Load and process data for a specific year and scenario.
+    return ds_fixed
+
+# Function to map scenarios to their baseline and no-fire files
+def find_scenario_files(files=None):
+    """Match CESM PM2.5 file names to (scenario, fire) pairs.
     
     Parameters:
-        year (int): Year to process
-        scenario (str): RCP scenario ("45" or "85")
+        files (list, optional): File names to match (defaults to the files in data_dir)
     
     Returns:
-        tuple: (wildfire_pm25, baseline_pm25, nofire_pm25) - DataArrays for each component
+        dict: Maps (scenario, fire) to the file Path, where scenario is '2000' or
+            '<year>_<rcp>' (e.g. '2050_45') and fire is 'Baseline' or 'NoFire'
     """
-    print(f"Processing {year} RCP {scenario[0]}.{scenario[1]} scenario")
+    scenario_files = {}
+    for f in (pm25_files if files is None else files):
+        match = PM25_FILE_PATTERN.match(f)
+        if match is None:
+            continue
+        scenario = match['year'] if match['rcp'] is None else f"{match['year']}_{match['rcp']}"
+        fire = 'NoFire' if match['nofire'] else 'Baseline'
+        scenario_files[(scenario, fire)] = Path(data_dir) / f
+    return scenario_files
+
+# Paths of the scenario files, built once at import
+SCENARIO_FILES = find_scenario_files()
+
+# Function to choose the xarray backend for a data file
+def backend_kwargs_for(path):
+    """Return the xarray open arguments best suited to a data file.
     
-    # Define file paths
-    baseline_path = os.path.join(data_dir, f'CESM_09x125_PM25_{year}_RCP{scenario}.nc')
-    nofire_path = os.path.join(data_dir, f'CESM_09x125_PM25_{year}_RCP{scenario}_NoFire.nc')
+    netCDF4/HDF5 files are read with h5netcdf and an enlarged HDF5 chunk cache
+    (when h5netcdf is installed); other files, such as the netCDF3 classic
+    CESM files, use xarray's default backend.
     
-    # Load datasets
-    baseline_ds = xr.open_dataset(baseline_path)
-    nofire_ds = xr.open_dataset(nofire_path)
+    Parameters:
+        path (str or pathlib.Path): Path of the data file
     
-    # Extract PM2.5 and process
-    baseline_pm25 = baseline_ds['pm25']
-    nofire_pm25 = nofire_ds['pm25']
+    Returns:
+        dict: Keyword arguments for xr.open_dataset / xr.open_mfdataset
+    """
+    with open(path, 'rb') as f:
+        is_hdf5 = f.read(len(HDF5_SIGNATURE)) == HDF5_SIGNATURE
+    if is_hdf5 and H5NETCDF_AVAILABLE:
+        return {'engine': 'h5netcdf',
+                'backend_kwargs': {'driver_kwds': {'rdcc_nbytes': H5_CHUNK_CACHE_BYTES}}}
+    return {}
+
+def _select_pm25(ds):
+    """Keep only the PM2.5 variable of a CESM dataset (open_mfdataset preprocess)."""
+    return ds[['pm25']]
+
+# Function to open the PM2.5 data of several scenarios at once
+def open_pm25_scenarios(scenarios=SCENARIOS):
+    """Open the baseline and no-fire PM2.5 data of several scenarios as one array.
     
-    # Take time average if needed
-    if 'time' in baseline_pm25.dims:
-        baseline_pm25 = baseline_pm25.mean(dim='time')
-    if 'time' in nofire_pm25.dims:
-        nofire_pm25 = nofire_pm25.mean(dim='time')
+    All files are opened lazily with a single open_mfdataset call and stacked
+    along new 'scenario' and 'fire' dimensions.
     
-    # Fix longitude coordinates
-    baseline_pm25 = fix_lon(baseline_pm25)
-    nofire_pm25 = fix_lon(nofire_pm25)
+    Parameters:
+        scenarios (list): Scenario labels, e.g. ['2000', '2050_45']
     
-    # Calculate wildfire contribution
-    wildfire_pm25 = baseline_pm25 - nofire_pm25
+    Returns:
+        xarray.DataArray: Lazy (dask-backed) float32 PM2.5 in μg/m³ with dims
+            (scenario, fire, time, lat, lon) and longitudes in (-180, 180); call
+            its close() method to release the files
+    """
+    fires = ['Baseline', 'NoFire']
+    paths = [[SCENARIO_FILES[(scenario, fire)] for fire in fires] for scenario in scenarios]
+    
+    ds = xr.open_mfdataset(
+        paths, combine='nested', concat_dim=['scenario', 'fire'],
+        preprocess=_select_pm25, chunks=CHUNKS, parallel=True,
+        coords='minimal', compat='override', **backend_kwargs_for(paths[0][0]))
+    ds = ds.assign_coords(scenario=scenarios, fire=fires)
+    
+    # Extract PM2.5 as float32 and fix longitude coordinates
+    pm25 = fix_lon(ds['pm25'].astype('float32', copy=False))
+    
+    # Let pm25.close() release the underlying files
+    pm25.set_close(ds.close)
+    return pm25
+
+# Function to calculate the wildfire contribution to PM2.5
+def calculate_wildfire_pm25(pm25):
+    """Calculate the time-averaged wildfire PM2.5 of every scenario at once.
+    
+    Parameters:
+        pm25 (xarray.DataArray): PM2.5 with a 'fire' dimension, as returned by
+            open_pm25_scenarios
     
-    # Basic statistics of wildfire PM2.5
-    print(f"Wildfire PM2.5 ({year} RCP {scenario[0]}.{scenario[1]}) - "
-          f"Min: {wildfire_pm25.min().values:.2f}, "
-          f"Max: {wildfire_pm25.max().values:.2f}, "
-          f"Mean: {wildfire_pm25.mean().values:.2f} μg/m³")
+    Returns:
+        xarray.DataArray: Wildfire PM2.5 (baseline minus no-fire) in μg/m³
+    """
+    wildfire_pm25 = pm25.sel(fire='Baseline', drop=True) - pm25.sel(fire='NoFire', drop=True)
     
-    return wildfire_pm25, baseline_pm25, nofire_pm25
+    # Take the time average after subtracting: by linearity of the mean this
+    # equals the difference of the two averages, with a single reduction.
+    # A single time step needs no reduction at all.
+    if 'time' in wildfire_pm25.dims:
+        if wildfire_pm25.sizes['time'] == 1:
+            wildfire_pm25 = wildfire_pm25.squeeze('time', drop=True)
+        else:
+            wildfire_pm25 = wildfire_pm25.mean(dim='time')
+    assert wildfire_pm25.dtype == np.float32
+    return wildfire_pm25
+
+# Kernels applying the solar potential equation to plain arrays
+if NUMBA_AVAILABLE:
+    # Compiled loops: scale, cap and (for the difference) subtract in a single
+    # pass per element. The comparison is written so NaN inputs stay NaN. These
+    # are serial and release the GIL, so dask's threads run the chunks in parallel.
+    @numba.njit(cache=True, nogil=True)
+    def _solar_potential_numba(pm25_values):
+        flat = pm25_values.ravel()
+        out = np.empty(flat.size, dtype=np.float32)
+        for i in range(flat.size):
+            value = SOLAR_SENSITIVITY * flat[i]
+            out[i] = SOLAR_LOSS_CAP if value < SOLAR_LOSS_CAP else value
+        return out.reshape(pm25_values.shape)
+
+    @numba.njit(cache=True, nogil=True)
+    def _solar_potential_difference_numba(pm25_later, pm25_earlier):
+        later = pm25_later.ravel()
+        earlier = pm25_earlier.ravel()
+        out = np.empty(later.size, dtype=np.float32)
+        for i in range(later.size):
+            value_later = SOLAR_SENSITIVITY * later[i]
+            value_earlier = SOLAR_SENSITIVITY * earlier[i]
+            if value_later < SOLAR_LOSS_CAP:
+                value_later = SOLAR_LOSS_CAP
+            if value_earlier < SOLAR_LOSS_CAP:
+                value_earlier = SOLAR_LOSS_CAP
+            out[i] = value_later - value_earlier
+        return out.reshape(pm25_later.shape)
+
+def _solar_potential_kernel(pm25_values):
+    """Scale PM2.5 values to solar potential change (%) and cap at -100%, in one pass."""
+    if NUMBA_AVAILABLE:
+        return _solar_potential_numba(np.ascontiguousarray(pm25_values, dtype=np.float32))
+    # Cap in place on the scaled array: no boolean mask, no second allocation
+    solar_values = SOLAR_SENSITIVITY * np.asarray(pm25_values)
+    return np.clip(solar_values, SOLAR_LOSS_CAP, None, out=solar_values)
+
+def _solar_potential_difference_kernel(pm25_later, pm25_earlier):
+    """Solar potential change of pm25_later minus that of pm25_earlier, in one pass."""
+    pm25_later, pm25_earlier = np.broadcast_arrays(pm25_later, pm25_earlier)
+    if NUMBA_AVAILABLE:
+        return _solar_potential_difference_numba(
+            np.ascontiguousarray(pm25_later, dtype=np.float32),
+            np.ascontiguousarray(pm25_earlier, dtype=np.float32))
+    solar_diff = _solar_potential_kernel(pm25_later)
+    solar_diff -= _solar_potential_kernel(pm25_earlier)
+    return solar_diff
 
 # Function to calculate solar power potential change based on PM2.5 concentration
 def calculate_solar_potential_change(pm25_data):
@@ -119,11 +336,11 @@ def calculate_solar_potential_change(pm25_data):
         xarray.DataArray: Percentage change in solar power potential
     """
     # Apply the equation: potential change (%) = -0.48 * pm2.5 / 17.71 * 100
-    # with a hard cap at -100% (complete loss of solar potential)
-    uncapped_change = -0.48 * pm25_data / 17.71 * 100
-    
-    # Apply the cap at -100% (complete loss of solar potential)
-    solar_potential_change = xr.where(uncapped_change < -100, -100, uncapped_change)
+    # with a hard cap at -100% (complete loss of solar potential), fused into
+    # a single elementwise kernel
+    solar_potential_change = xr.apply_ufunc(
+        _solar_potential_kernel, pm25_data.astype('float32', copy=False),
+        dask='parallelized', output_dtypes=[np.float32])
     
     # Add attributes for clarity
     solar_potential_change.attrs['units'] = '%'
@@ -132,189 +349,241 @@ def calculate_solar_potential_change(pm25_data):
     
     return solar_potential_change
 
-# Main processing function
-def main():
-    print("Starting PM2.5 data processing...")
+# Function to calculate the change in solar power potential between two PM2.5 fields
+def calculate_solar_potential_difference(pm25_later, pm25_earlier):
+    """
+    Calculate the difference in solar power potential change between two PM2.5 fields.
+    
+    Equivalent to subtracting the results of calculate_solar_potential_change, but
+    evaluated directly from the PM2.5 fields in a single pass.
+    
+    Parameters:
+        pm25_later (xarray.DataArray): PM2.5 concentration of the later period in μg/m³
+        pm25_earlier (xarray.DataArray): PM2.5 concentration of the earlier period in μg/m³
+        
+    Returns:
+        xarray.DataArray: Difference in percentage change in solar power potential
+    """
+    solar_potential_diff = xr.apply_ufunc(
+        _solar_potential_difference_kernel,
+        pm25_later.astype('float32', copy=False), pm25_earlier.astype('float32', copy=False),
+        dask='parallelized', output_dtypes=[np.float32])
+    
+    # Add attributes for clarity
+    solar_potential_diff.attrs['units'] = '%'
+    solar_potential_diff.attrs['long_name'] = 'Change in Solar Power Potential'
     
-    # Load and Process 2000 Baseline Data
-    print("\n--- Processing 2000 Baseline Data ---")
-    baseline_2000_path = os.path.join(data_dir, 'CESM_09x125_PM25_2000_Baseline.nc')
-    nofire_2000_path = os.path.join(data_dir, 'CESM_09x125_PM25_2000_BaseLine_NoFire.nc')
+    return solar_potential_diff
 
-    # Load data
-    baseline_2000_ds = xr.open_dataset(baseline_2000_path)
-    nofire_2000_ds = xr.open_dataset(nofire_2000_path)
+# Function to compute summary statistics for several DataArrays at once
+def compute_statistics(data_arrays):
+    """
+    Compute the min, max and mean of several (lazy) DataArrays in a single pass.
+    
+    Parameters:
+        data_arrays (dict): Dictionary of (name, xarray.DataArray) pairs
+        
+    Returns:
+        xarray.Dataset: One variable per input name, indexed by a 'stat' dimension
+            holding the 'min', 'max' and 'mean' values
+    """
+    data = xr.Dataset(data_arrays)
+    
+    # Batch the reductions of every variable into one graph so dask shares
+    # the scan of each input across all statistics
+    stats = xr.concat([data.min(), data.max(), data.mean()],
+                      dim=pd.Index(['min', 'max', 'mean'], name='stat'))
+    
+    # Materialize every statistic in one dask graph execution
+    return stats.compute()
 
+# Function to log the summary statistics of one variable
+def log_statistics(stats, name, label, units):
+    """
+    Log the min, max and mean of a variable from precomputed statistics.
+    
+    Parameters:
+        stats (xarray.Dataset): Statistics returned by compute_statistics
+        name (str): Name of the variable in stats
+        label (str): Label to log before the statistics
+        units (str): Units of the variable
+    """
+    values = stats[name]
+    logger.info("  %s - Min: %.2f %s, Max: %.2f %s, Mean: %.2f %s", label,
+                float(values.sel(stat='min')), units,
+                float(values.sel(stat='max')), units,
+                float(values.sel(stat='mean')), units)
+
+# Function to check whether the results cache is up to date
+def _cache_is_fresh(cache_path=CACHE_PATH):
+    """Return True if the cache exists and is newer than the input files and this module."""
+    if not os.path.exists(cache_path):
+        return False
+    sources = list(SCENARIO_FILES.values()) + [__file__]
+    return os.path.getmtime(cache_path) > max(os.path.getmtime(path) for path in sources)
+
+# Function to save processed results to the Zarr cache
+def save_results(results, cache_path=CACHE_PATH):
+    """
+    Save the processed variables to a Zarr store, compressed with Blosc/Zstd.
+    
+    Does nothing if zarr is not installed, and only logs a warning if the
+    store cannot be written.
+    
+    Parameters:
+        results (dict): Dictionary of (name, xarray.DataArray) pairs, as returned by main
+        cache_path (str, optional): Path of the Zarr store
+    """
+    if not ZARR_AVAILABLE:
+        return
+    
+    # Blosc with Zstd decompresses at GB/s per core with a good ratio
+    if int(zarr.__version__.split('.')[0]) >= 3:
+        compression = {'compressors': [zarr.codecs.BloscCodec(cname='zstd', clevel=3, shuffle='bitshuffle')]}
+    else:
+        import numcodecs
+        compression = {'compressor': numcodecs.Blosc(cname='zstd', clevel=3, shuffle=numcodecs.Blosc.BITSHUFFLE)}
+    
+    # Write to a temporary store and move it into place once complete, so an
+    # interrupted write never leaves a partial store that looks fresh
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        xr.Dataset(results).to_zarr(tmp_path, mode='w', consolidated=False,
+                                    encoding={name: compression for name in results})
+        shutil.rmtree(cache_path, ignore_errors=True)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        # The cache is only an optimization: a read-only or full disk must not
+        # lose the results that were just computed
+        logger.warning("Could not cache processed data to %s: %s", cache_path, e)
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        return
+    logger.info("Cached processed data to %s", cache_path)
+
+# Function to load processed results from the Zarr cache
+def load_cached_results(cache_path=CACHE_PATH):
+    """
+    Load the processed variables saved by main() if the cache is up to date.
+    
+    Parameters:
+        cache_path (str, optional): Path of the Zarr store
+        
+    Returns:
+        xarray.Dataset or None: Lazily opened processed variables (indexable by the
+            same names as the dict returned by main), or None on a cache miss
+    """
+    if not ZARR_AVAILABLE or not _cache_is_fresh(cache_path):
+        return None
+    return xr.open_zarr(cache_path, chunks={}, consolidated=False)
+
+# Main processing function
+def main():
+    logger.info("Starting PM2.5 data processing...")
+    
+    # Load PM2.5 Data for All Scenarios
+    logger.info("\n--- Loading PM2.5 Data ---")
+    pm25 = open_pm25_scenarios(SCENARIOS)
+    
     # Examine data structure
-    print("Baseline 2000 Dataset:")
-    print(baseline_2000_ds)
-    print("\nNo-Fire 2000 Dataset:")
-    print(nofire_2000_ds)
-
-    # Extract PM2.5 variables
-    baseline_pm25_2000 = baseline_2000_ds['pm25']
-    nofire_pm25_2000 = nofire_2000_ds['pm25']
-
-    # Take time average if needed
-    if 'time' in baseline_pm25_2000.dims:
-        baseline_pm25_2000 = baseline_pm25_2000.mean(dim='time')
-    if 'time' in nofire_pm25_2000.dims:
-        nofire_pm25_2000 = nofire_pm25_2000.mean(dim='time')
-
-    # Fix longitude coordinates
-    baseline_pm25_2000 = fix_lon(baseline_pm25_2000)
-    nofire_pm25_2000 = fix_lon(nofire_pm25_2000)
-
-    # Show dimensions after processing
-    print("Processed baseline PM2.5 dims:", baseline_pm25_2000.dims)
-    print("Processed no-fire PM2.5 dims:", nofire_pm25_2000.dims)
-
-    # Calculate wildfire contribution for 2000 by subtraction
-    wildfire_pm25_2000 = baseline_pm25_2000 - nofire_pm25_2000
-
-    # Basic statistics of wildfire PM2.5
-    print(f"Wildfire PM2.5 (2000) - Min: {wildfire_pm25_2000.min().values:.2f}, "
-          f"Max: {wildfire_pm25_2000.max().values:.2f}, "
-          f"Mean: {wildfire_pm25_2000.mean().values:.2f} μg/m³")
-    
-    # Process 2050 Data (RCP 4.5 and RCP 8.5)
-    print("\n--- Processing 2050 Data ---")
-    wildfire_pm25_2050_45, baseline_pm25_2050_45, nofire_pm25_2050_45 = process_scenario_data(2050, "45")
-    wildfire_pm25_2050_85, baseline_pm25_2050_85, nofire_pm25_2050_85 = process_scenario_data(2050, "85")
-    
-    # Process 2100 Data (RCP 4.5 and RCP 8.5)
-    print("\n--- Processing 2100 Data ---")
-    wildfire_pm25_2100_45, baseline_pm25_2100_45, nofire_pm25_2100_45 = process_scenario_data(2100, "45")
-    wildfire_pm25_2100_85, baseline_pm25_2100_85, nofire_pm25_2100_85 = process_scenario_data(2100, "85")
+    logger.info("PM2.5 Data:\n%s", pm25)
+    
+    # Calculate wildfire contribution for all scenarios by subtraction
+    logger.info("\n--- Calculating Wildfire PM2.5 ---")
+    wildfire_pm25 = calculate_wildfire_pm25(pm25)
+    logger.info("Processed wildfire PM2.5 dims: %s", wildfire_pm25.dims)
+    
+    # The wildfire fields feed every temporal change, so keep them in memory
+    # rather than recomputing them for each downstream branch
+    wildfire_pm25 = wildfire_pm25.persist()
+    
+    # Nothing downstream reads the input files any more: release the file
+    # handles and drop the reference to the baseline and no-fire data
+    pm25.close()
+    del pm25
+    
+    wildfire_pm25_2000 = wildfire_pm25.sel(scenario='2000', drop=True)
+    wildfire_pm25_2050_45 = wildfire_pm25.sel(scenario='2050_45', drop=True)
+    wildfire_pm25_2050_85 = wildfire_pm25.sel(scenario='2050_85', drop=True)
+    wildfire_pm25_2100_45 = wildfire_pm25.sel(scenario='2100_45', drop=True)
+    wildfire_pm25_2100_85 = wildfire_pm25.sel(scenario='2100_85', drop=True)
     
     # Calculate Temporal Changes in Wildfire PM2.5
-    print("\n--- Calculating Temporal Changes in Wildfire PM2.5 ---")
+    logger.info("\n--- Calculating Temporal Changes in Wildfire PM2.5 ---")
     change_2000_to_2050_45 = wildfire_pm25_2050_45 - wildfire_pm25_2000
     change_2000_to_2050_85 = wildfire_pm25_2050_85 - wildfire_pm25_2000
     change_2050_to_2100_45 = wildfire_pm25_2100_45 - wildfire_pm25_2050_45
     change_2050_to_2100_85 = wildfire_pm25_2100_85 - wildfire_pm25_2050_85
     change_2000_to_2100_45 = wildfire_pm25_2100_45 - wildfire_pm25_2000
     change_2000_to_2100_85 = wildfire_pm25_2100_85 - wildfire_pm25_2000
-
-    # Print statistics for RCP 4.5 changes
-    print("Change from 2000 to 2050 (RCP 4.5):")
-    print(f"Min: {change_2000_to_2050_45.min().values:.2f}, "
-          f"Max: {change_2000_to_2050_45.max().values:.2f}, "
-          f"Mean: {change_2000_to_2050_45.mean().values:.2f} μg/m³")
-
-    print("\nChange from 2050 to 2100 (RCP 4.5):")
-    print(f"Min: {change_2050_to_2100_45.min().values:.2f}, "
-          f"Max: {change_2050_to_2100_45.max().values:.2f}, "
-          f"Mean: {change_2050_to_2100_45.mean().values:.2f} μg/m³")
-
-    print("\nChange from 2000 to 2100 (RCP 4.5):")
-    print(f"Min: {change_2000_to_2100_45.min().values:.2f}, "
-          f"Max: {change_2000_to_2100_45.max().values:.2f}, "
-          f"Mean: {change_2000_to_2100_45.mean().values:.2f} μg/m³")
-
-    # Print statistics for RCP 8.5 changes
-    print("\nChange from 2000 to 2050 (RCP 8.5):")
-    print(f"Min: {change_2000_to_2050_85.min().values:.2f}, "
-          f"Max: {change_2000_to_2050_85.max().values:.2f}, "
-          f"Mean: {change_2000_to_2050_85.mean().values:.2f} μg/m³")
-
-    print("\nChange from 2050 to 2100 (RCP 8.5):")
-    print(f"Min: {change_2050_to_2100_85.min().values:.2f}, "
-          f"Max: {change_2050_to_2100_85.max().values:.2f}, "
-          f"Mean: {change_2050_to_2100_85.mean().values:.2f} μg/m³")
-
-    print("\nChange from 2000 to 2100 (RCP 8.5):")
-    print(f"Min: {change_2000_to_2100_85.min().values:.2f}, "
-          f"Max: {change_2000_to_2100_85.max().values:.2f}, "
-          f"Mean: {change_2000_to_2100_85.mean().values:.2f} μg/m³")
     
     # Calculate Solar Power Potential Changes
-    print("\n--- Calculating Solar Power Potential Changes ---")
+    logger.info("\n--- Calculating Solar Power Potential Changes ---")
     solar_change_2000 = calculate_solar_potential_change(wildfire_pm25_2000)
     solar_change_2050_45 = calculate_solar_potential_change(wildfire_pm25_2050_45)
     solar_change_2050_85 = calculate_solar_potential_change(wildfire_pm25_2050_85)
     solar_change_2100_45 = calculate_solar_potential_change(wildfire_pm25_2100_45)
     solar_change_2100_85 = calculate_solar_potential_change(wildfire_pm25_2100_85)
-
-    # Print statistics for solar power potential changes
-    print("Solar Power Potential Change (2000):")
-    print(f"Min: {solar_change_2000.min().values:.2f}%, "
-          f"Max: {solar_change_2000.max().values:.2f}%, "
-          f"Mean: {solar_change_2000.mean().values:.2f}%")
-
-    print("\nSolar Power Potential Change (2050 RCP 4.5):")
-    print(f"Min: {solar_change_2050_45.min().values:.2f}%, "
-          f"Max: {solar_change_2050_45.max().values:.2f}%, "
-          f"Mean: {solar_change_2050_45.mean().values:.2f}%")
-
-    print("\nSolar Power Potential Change (2050 RCP 8.5):")
-    print(f"Min: {solar_change_2050_85.min().values:.2f}%, "
-          f"Max: {solar_change_2050_85.max().values:.2f}%, "
-          f"Mean: {solar_change_2050_85.mean().values:.2f}%")
-
-    print("\nSolar Power Potential Change (2100 RCP 4.5):")
-    print(f"Min: {solar_change_2100_45.min().values:.2f}%, "
-          f"Max: {solar_change_2100_45.max().values:.2f}%, "
-          f"Mean: {solar_change_2100_45.mean().values:.2f}%")
-
-    print("\nSolar Power Potential Change (2100 RCP 8.5):")
-    print(f"Min: {solar_change_2100_85.min().values:.2f}%, "
-          f"Max: {solar_change_2100_85.max().values:.2f}%, "
-          f"Mean: {solar_change_2100_85.mean().values:.2f}%")
     
     # Calculate Changes in Solar Power Potential Over Time
-    print("\n--- Calculating Changes in Solar Power Potential Over Time ---")
-    solar_diff_2000_to_2050_45 = solar_change_2050_45 - solar_change_2000
-    solar_diff_2000_to_2050_85 = solar_change_2050_85 - solar_change_2000
-    solar_diff_2050_to_2100_45 = solar_change_2100_45 - solar_change_2050_45
-    solar_diff_2050_to_2100_85 = solar_change_2100_85 - solar_change_2050_85
-    solar_diff_2000_to_2100_45 = solar_change_2100_45 - solar_change_2000
-    solar_diff_2000_to_2100_85 = solar_change_2100_85 - solar_change_2000
-
-    # Print statistics for changes in solar power potential
-    print("Change in Solar Power Potential from 2000 to 2050 (RCP 4.5):")
-    print(f"Min: {solar_diff_2000_to_2050_45.min().values:.2f}%, "
-          f"Max: {solar_diff_2000_to_2050_45.max().values:.2f}%, "
-          f"Mean: {solar_diff_2000_to_2050_45.mean().values:.2f}%")
-
-    print("\nChange in Solar Power Potential from 2000 to 2050 (RCP 8.5):")
-    print(f"Min: {solar_diff_2000_to_2050_85.min().values:.2f}%, "
-          f"Max: {solar_diff_2000_to_2050_85.max().values:.2f}%, "
-          f"Mean: {solar_diff_2000_to_2050_85.mean().values:.2f}%")
-
-    print("\nChange in Solar Power Potential from 2050 to 2100 (RCP 4.5):")
-    print(f"Min: {solar_diff_2050_to_2100_45.min().values:.2f}%, "
-          f"Max: {solar_diff_2050_to_2100_45.max().values:.2f}%, "
-          f"Mean: {solar_diff_2050_to_2100_45.mean().values:.2f}%")
-
-    print("\nChange in Solar Power Potential from 2050 to 2100 (RCP 8.5):")
-    print(f"Min: {solar_diff_2050_to_2100_85.min().values:.2f}%, "
-          f"Max: {solar_diff_2050_to_2100_85.max().values:.2f}%, "
-          f"Mean: {solar_diff_2050_to_2100_85.mean().values:.2f}%")
-
-    print("\nChange in Solar Power Potential from 2000 to 2100 (RCP 4.5):")
-    print(f"Min: {solar_diff_2000_to_2100_45.min().values:.2f}%, "
-          f"Max: {solar_diff_2000_to_2100_45.max().values:.2f}%, "
-          f"Mean: {solar_diff_2000_to_2100_45.mean().values:.2f}%")
-
-    print("\nChange in Solar Power Potential from 2000 to 2100 (RCP 8.5):")
-    print(f"Min: {solar_diff_2000_to_2100_85.min().values:.2f}%, "
-          f"Max: {solar_diff_2000_to_2100_85.max().values:.2f}%, "
-          f"Mean: {solar_diff_2000_to_2100_85.mean().values:.2f}%")
-    
-    print("\n--- Processing Complete ---")
-    print("The following variables are now available for further analysis:")
+    logger.info("\n--- Calculating Changes in Solar Power Potential Over Time ---")
+    solar_diff_2000_to_2050_45 = calculate_solar_potential_difference(wildfire_pm25_2050_45, wildfire_pm25_2000)
+    solar_diff_2000_to_2050_85 = calculate_solar_potential_difference(wildfire_pm25_2050_85, wildfire_pm25_2000)
+    solar_diff_2050_to_2100_45 = calculate_solar_potential_difference(wildfire_pm25_2100_45, wildfire_pm25_2050_45)
+    solar_diff_2050_to_2100_85 = calculate_solar_potential_difference(wildfire_pm25_2100_85, wildfire_pm25_2050_85)
+    solar_diff_2000_to_2100_45 = calculate_solar_potential_difference(wildfire_pm25_2100_45, wildfire_pm25_2000)
+    solar_diff_2000_to_2100_85 = calculate_solar_potential_difference(wildfire_pm25_2100_85, wildfire_pm25_2000)
+    
+    # Collect all processed variables
+    results = {
+        "wildfire_pm25_2000": wildfire_pm25_2000,
+        "wildfire_pm25_2050_45": wildfire_pm25_2050_45,
+        "wildfire_pm25_2050_85": wildfire_pm25_2050_85,
+        "wildfire_pm25_2100_45": wildfire_pm25_2100_45,
+        "wildfire_pm25_2100_85": wildfire_pm25_2100_85,
+        "change_2000_to_2050_45": change_2000_to_2050_45,
+        "change_2000_to_2050_85": change_2000_to_2050_85,
+        "change_2050_to_2100_45": change_2050_to_2100_45,
+        "change_2050_to_2100_85": change_2050_to_2100_85,
+        "change_2000_to_2100_45": change_2000_to_2100_45,
+        "change_2000_to_2100_85": change_2000_to_2100_85,
+        "solar_change_2000": solar_change_2000,
+        "solar_change_2050_45": solar_change_2050_45,
+        "solar_change_2050_85": solar_change_2050_85,
+        "solar_change_2100_45": solar_change_2100_45,
+        "solar_change_2100_85": solar_change_2100_85,
+        "solar_diff_2000_to_2050_45": solar_diff_2000_to_2050_45,
+        "solar_diff_2000_to_2050_85": solar_diff_2000_to_2050_85,
+        "solar_diff_2050_to_2100_45": solar_diff_2050_to_2100_45,
+        "solar_diff_2050_to_2100_85": solar_diff_2050_to_2100_85,
+        "solar_diff_2000_to_2100_45": solar_diff_2000_to_2100_45,
+        "solar_diff_2000_to_2100_85": solar_diff_2000_to_2100_85
+    }
+    
+    # Everything above is a lazy dask graph; it is computed once here and kept
+    # in memory, so the statistics, the cache write and the caller reuse it
+    persisted = xr.Dataset(results).persist()
+    results = {name: persisted[name] for name in results}
+    
+    # Compute Summary Statistics
+    # All min/max/mean values are materialized in a single pass, and only if
+    # they are going to be logged
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n--- Computing Summary Statistics ---")
+        stats = compute_statistics(results)
+    
+        # Log the statistics of every variable from the materialized result
+        for heading, units, entries in STATISTICS_REPORT:
+            logger.info("\n%s:", heading)
+            for label, name in entries:
+                log_statistics(stats, name, label, units)
+    
+    logger.info("\n--- Processing Complete ---")
+    logger.info("The following variables are now available for further analysis:")
     
     # List of all processed variables
     variables = {
-        "Baseline PM2.5": [
-            "baseline_pm25_2000", "baseline_pm25_2050_45", "baseline_pm25_2050_85", 
-            "baseline_pm25_2100_45", "baseline_pm25_2100_85"
-        ],
-        "No-Fire PM2.5": [
-            "nofire_pm25_2000", "nofire_pm25_2050_45", "nofire_pm25_2050_85", 
-            "nofire_pm25_2100_45", "nofire_pm25_2100_85"
-        ],
         "Wildfire PM2.5": [
             "wildfire_pm25_2000", "wildfire_pm25_2050_45", "wildfire_pm25_2050_85", 
             "wildfire_pm25_2100_45", "wildfire_pm25_2100_85"
@@ -337,46 +606,20 @@ def main():
     
     # Print variable categories and names
     for category, vars_list in variables.items():
-        print(f"\n{category}:")
+        logger.info("\n%s:", category)
         for var in vars_list:
-            print(f"  - {var}")
+            logger.info("  - %s", var)
+    
+    # Cache the results so later runs can skip the processing
+    save_results(results)
     
     # Return all processed variables for potential further use
-    return {
-        "baseline_pm25_2000": baseline_pm25_2000,
-        "baseline_pm25_2050_45": baseline_pm25_2050_45,
-        "baseline_pm25_2050_85": baseline_pm25_2050_85,
-        "baseline_pm25_2100_45": baseline_pm25_2100_45,
-        "baseline_pm25_2100_85": baseline_pm25_2100_85,
-        "nofire_pm25_2000": nofire_pm25_2000,
-        "nofire_pm25_2050_45": nofire_pm25_2050_45,
-        "nofire_pm25_2050_85": nofire_pm25_2050_85,
-        "nofire_pm25_2100_45": nofire_pm25_2100_45,
-        "nofire_pm25_2100_85": nofire_pm25_2100_85,
-        "wildfire_pm25_2000": wildfire_pm25_2000,
-        "wildfire_pm25_2050_45": wildfire_pm25_2050_45,
-        "wildfire_pm25_2050_85": wildfire_pm25_2050_85,
-        "wildfire_pm25_2100_45": wildfire_pm25_2100_45,
-        "wildfire_pm25_2100_85": wildfire_pm25_2100_85,
-        "change_2000_to_2050_45": change_2000_to_2050_45,
-        "change_2000_to_2050_85": change_2000_to_2050_85,
-        "change_2050_to_2100_45": change_2050_to_2100_45,
-        "change_2050_to_2100_85": change_2050_to_2100_85,
-        "change_2000_to_2100_45": change_2000_to_2100_45,
-        "change_2000_to_2100_85": change_2000_to_2100_85,
-        "solar_change_2000": solar_change_2000,
-        "solar_change_2050_45": solar_change_2050_45,
-        "solar_change_2050_85": solar_change_2050_85,
-        "solar_change_2100_45": solar_change_2100_45,
-        "solar_change_2100_85": solar_change_2100_85,
-        "solar_diff_2000_to_2050_45": solar_diff_2000_to_2050_45,
-        "solar_diff_2000_to_2050_85": solar_diff_2000_to_2050_85,
-        "solar_diff_2050_to_2100_45": solar_diff_2050_to_2100_45,
-        "solar_diff_2050_to_2100_85": solar_diff_2050_to_2100_85,
-        "solar_diff_2000_to_2100_45": solar_diff_2000_to_2100_45,
-        "solar_diff_2000_to_2100_85": solar_diff_2000_to_2100_85
-    }
+    return results
 
 # Run the main function if script is executed directly
 if __name__ == "__main__":
+    # Progress and summary statistics are only logged (and the statistics
+    # only computed) with -v/--verbose
+    verbose = '-v' in sys.argv[1:] or '--verbose' in sys.argv[1:]
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING, format='%(message)s')
     main()
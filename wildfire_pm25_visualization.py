@@ -19,7 +19,12 @@ Usage:
     If output_dir is not provided, figures will be saved to ./figures
 """
 
+import functools
+import hashlib
+import inspect
+import io
 import os
+import shutil
 import sys
 
 # Try to import dependencies, but don't fail if they're not available
@@ -27,10 +32,14 @@ try:
     import numpy as np
     import pandas as pd
     import xarray as xr
+    import matplotlib
     import matplotlib.pyplot as plt
     import matplotlib.colors as mcolors
+    from matplotlib._pylab_helpers import Gcf
+    from matplotlib.font_manager import FontProperties
     from matplotlib.ticker import ScalarFormatter, MultipleLocator
     import seaborn as sns
+    import cartopy
     import cartopy.crs as ccrs
     import cartopy.feature as cfeature
     from cartopy.mpl.gridliner import LONGITUDE_FORMATTER, LATITUDE_FORMATTER
@@ -39,6 +48,21 @@ except ImportError:
     DEPENDENCIES_AVAILABLE = False
     print("Warning: Some dependencies are not available. Visualization functions will not work.")
 
+# datashader is optional; it provides a faster raster backend for the map functions
+try:
+    import datashader as ds
+    import datashader.transfer_functions as tf
+    DATASHADER_AVAILABLE = True
+except ImportError:
+    DATASHADER_AVAILABLE = False
+
+# numba is optional; it compiles the regional mean reduction into one loop
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 try:
     import wildfire_pm25_processing as wpp
 except ImportError:
@@ -50,6 +74,18 @@ DEFAULT_OUTPUT_DIR = './figures'
 # Global variable for output directory
 output_dir = DEFAULT_OUTPUT_DIR
 
+# Directory of rendered figures keyed by a hash of their inputs (None disables
+# the cache). Only the most recently used FIGURE_CACHE_MAX_ENTRIES figures are
+# kept, a few hundred MB at most for the figures of this package. The key
+# includes the matplotlib/cartopy/datashader versions but not the Natural
+# Earth data, so delete the directory after updating that data.
+FIGURE_CACHE_DIR = './cache/figures'
+FIGURE_CACHE_MAX_ENTRIES = 200
+
+# Digest of this module's source, part of every figure cache key
+with open(__file__, 'rb') as _f:
+    _MODULE_DIGEST = hashlib.blake2b(_f.read(), digest_size=16).digest()
+
 # Define regions for regional analysis
 regions = {
     'North America': {'lat_min': 15, 'lat_max': 70, 'lon_min': -170, 'lon_max': -50},
@@ -86,11 +122,454 @@ def setup_visualization_env(out_dir=DEFAULT_OUTPUT_DIR):
     plt.rcParams['legend.fontsize'] = 10
     plt.rcParams['figure.titlesize'] = 16
     
+    # Split long paths into chunks when rendering with Agg
+    plt.rcParams['agg.path.chunksize'] = 10000
+    
     return out_dir
 
+# Function to save a figure to the output directory
+def save_figure(fig, filename, dpi=300, bbox_inches='tight'):
+    """
+    Save a figure to the output directory.
+    
+    The figure is rendered into an in-memory buffer and written to disk with
+    a single write call. For PNG output the 'Software' metadata entry is omitted.
+    
+    Parameters:
+        fig (matplotlib.figure.Figure): Figure to save
+        filename (str): Filename to save the figure (format inferred from its
+            extension, e.g. '.png', or '.jpg' for quick previews)
+        dpi (int, optional): Resolution of the saved figure
+        bbox_inches (str, optional): Bounding box passed to savefig
+    """
+    fmt = os.path.splitext(filename)[1].lstrip('.').lower() or 'png'
+    metadata = {'Software': None} if fmt == 'png' else None
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt, dpi=dpi, bbox_inches=bbox_inches, metadata=metadata)
+    with open(os.path.join(output_dir, filename), 'wb') as f:
+        f.write(buf.getbuffer())
+
+# Font shared by the figure annotations, so the style arguments are not repeated
+# at every call (matplotlib still copies it into each Text)
+_ANNOTATION_FP = FontProperties(family='sans-serif', size=9, style='italic') if DEPENDENCIES_AVAILABLE else None
+
+# Cleared figures kept for reuse, keyed by figure size. Idle figures are
+# taken out of pyplot's figure registry, so plt.show() and plt.get_fignums()
+# never see them
+_FIG_POOL = {}
+
+# Function to get a blank figure, reusing a released one of the same size
+def _acquire_fig(figsize):
+    """
+    Get a blank white figure of the given size and make it the current figure.
+    
+    A figure released with _release_fig is reused when available, which saves
+    the figure and canvas setup of a new one.
+    
+    Parameters:
+        figsize (tuple): Figure size in inches
+    
+    Returns:
+        matplotlib.figure.Figure: Empty figure
+    """
+    fig = _FIG_POOL.pop(tuple(figsize), None)
+    manager = fig.canvas.manager if fig is not None else None
+    # Its figure number may have been given to a new figure while it was idle
+    if manager is None or manager.num in Gcf.figs:
+        return plt.figure(figsize=figsize, facecolor='white')
+    Gcf.set_active(manager)
+    return fig
+
+# Function to clear a figure and keep it for the next figure of its size
+def _release_fig(fig):
+    """
+    Clear a figure and return it to the pool instead of closing it.
+    
+    Parameters:
+        fig (matplotlib.figure.Figure): Figure obtained from _acquire_fig
+    """
+    fig.clf()
+    manager = fig.canvas.manager
+    if manager is not None and Gcf.figs.get(manager.num) is manager:
+        del Gcf.figs[manager.num]
+    _FIG_POOL[tuple(fig.get_size_inches())] = fig
+
+# Function to feed a figure input into a hash
+def _hash_figure_input(h, value):
+    """
+    Update a hash with the contents of one figure function argument.
+    
+    Parameters:
+        h (hashlib.blake2b): Hash to update
+        value: Argument value (DataArray, DataFrame, dict, projection,
+            colormap, or any value with a stable repr)
+    """
+    if isinstance(value, xr.DataArray):
+        h.update(repr((value.dims, value.shape, str(value.dtype))).encode())
+        h.update(np.ascontiguousarray(value.values).tobytes())
+        for dim in value.dims:
+            if dim in value.coords:
+                h.update(np.ascontiguousarray(value[dim].values).tobytes())
+    elif isinstance(value, pd.DataFrame):
+        h.update(repr((list(value.index), list(value.columns))).encode())
+        h.update(np.ascontiguousarray(value.values).tobytes())
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            h.update(repr(key).encode())
+            _hash_figure_input(h, item)
+    elif isinstance(value, ccrs.Projection):
+        h.update(value.to_wkt().encode())
+    elif isinstance(value, mcolors.Colormap):
+        h.update(value(np.linspace(0, 1, 256)).tobytes())
+    else:
+        h.update(repr(value).encode())
+
+# Function to bound the size of the figure cache
+def _evict_figure_cache(max_entries=None):
+    """
+    Delete the least recently used figures beyond the cache size limit.
+    
+    Parameters:
+        max_entries (int, optional): Number of figures to keep (defaults to
+            FIGURE_CACHE_MAX_ENTRIES)
+    """
+    max_entries = FIGURE_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+    entries = []
+    for entry in os.scandir(FIGURE_CACHE_DIR):
+        if entry.is_file() and not entry.name.endswith('.tmp'):
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                pass
+    
+    entries.sort(reverse=True)
+    for _, path in entries[max_entries:]:
+        # Another worker may have evicted the same entry already
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+# Function to reuse previously rendered figures for unchanged inputs
+def cached_figure(func):
+    """
+    Decorate a figure function so that a figure rendered before from the same
+    inputs is copied from FIGURE_CACHE_DIR instead of being rendered again.
+    
+    The cache key covers every argument except the filename (only its
+    extension), the source of this module and the plotting library versions,
+    so code changes and library upgrades invalidate it. The least recently
+    used figures beyond FIGURE_CACHE_MAX_ENTRIES are deleted.
+    
+    Parameters:
+        func (callable): Figure function taking a 'filename' argument
+    
+    Returns:
+        callable: Wrapped figure function
+    """
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if FIGURE_CACHE_DIR is None:
+            return func(*args, **kwargs)
+        
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        filename = bound.arguments['filename']
+        
+        h = hashlib.blake2b(_MODULE_DIGEST, digest_size=16)
+        h.update(func.__name__.encode())
+        
+        # Library upgrades can change the rendering, so they invalidate the cache
+        versions = [matplotlib.__version__, cartopy.__version__]
+        if bound.arguments.get('backend') == 'datashader' and DATASHADER_AVAILABLE:
+            versions.append(ds.__version__)
+        h.update(repr(versions).encode())
+        for name, value in bound.arguments.items():
+            h.update(name.encode())
+            _hash_figure_input(h, os.path.splitext(value)[1] if name == 'filename' else value)
+        cache_path = os.path.join(FIGURE_CACHE_DIR, h.hexdigest() + os.path.splitext(filename)[1])
+        target = os.path.join(output_dir, filename)
+        
+        try:
+            shutil.copyfile(cache_path, target)
+            
+            # Mark the entry as recently used, so eviction keeps it
+            os.utime(cache_path)
+        except FileNotFoundError:
+            # Not cached, or just evicted by another worker: render it
+            pass
+        else:
+            print(f"Saved figure to {target} (cached)")
+            return
+        
+        func(*args, **kwargs)
+        
+        # Copy through a temporary file so concurrent workers never see a
+        # partially written cache entry
+        os.makedirs(FIGURE_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        shutil.copyfile(target, tmp_path)
+        os.replace(tmp_path, cache_path)
+        _evict_figure_cache()
+    
+    return wrapper
+
+# Function to add the data source and explanatory annotations to a figure
+def _add_standard_annotations(fig, extra_text, extra_color='darkred'):
+    """
+    Add the data source note (lower left) and an explanatory note (lower right)
+    to a figure.
+    
+    Parameters:
+        fig (matplotlib.figure.Figure): Figure to annotate
+        extra_text (str): Explanatory text for the lower right corner
+        extra_color (str, optional): Color of the explanatory text
+    """
+    ax = fig.gca()
+    ax.annotate('Data Source: CESM Climate Model', xy=(0.01, 0.01), xycoords='figure fraction',
+                ha='left', va='bottom', fontproperties=_ANNOTATION_FP)
+    ax.annotate(extra_text, xy=(0.99, 0.01), xycoords='figure fraction',
+                ha='right', va='bottom', fontproperties=_ANNOTATION_FP, color=extra_color)
+
+# Function to build the lookup table of a colormap with a white band
+def _patched_lut(name, mode, threshold):
+    """
+    Build the 256-entry RGBA lookup table of a colormap in which the colors
+    near zero are replaced by white.
+    
+    Parameters:
+        name (str): Name of the matplotlib colormap to start from
+        mode (str): Where near-zero values sit in the colormap: 'center' for
+            diverging data, 'low' or 'high' for sequential data
+        threshold (float): Fraction of the colormap to make white
+            (on each side of the center for mode 'center')
+    
+    Returns:
+        numpy.ndarray: (256, 4) array of RGBA colors
+    """
+    colors = plt.get_cmap(name)(np.linspace(0, 1, 256))
+    threshold_idx = int(256 * threshold)
+    
+    # Make the band white with full alpha
+    if mode == 'center':
+        center_idx = 128  # Center of the colormap
+        colors[max(center_idx - threshold_idx, 0):center_idx + threshold_idx] = 1.0
+    elif mode == 'low':
+        colors[:threshold_idx] = 1.0
+    elif mode == 'high':
+        colors[256 - threshold_idx:] = 1.0
+    else:
+        raise ValueError(f"Unknown white band mode: {mode}")
+    
+    return colors
+
+# Function to build a colormap with a white band
+@functools.lru_cache(maxsize=16)
+def white_banded_cmap(base_name, white_threshold, mode):
+    """
+    Build a colormap in which the colors near zero are replaced by white.
+    
+    Results are cached, so figures sharing a colormap reuse the same object
+    and its lookup table is only built once.
+    
+    Parameters:
+        base_name (str): Name of the matplotlib colormap to start from
+        white_threshold (float): Fraction of the colormap to make white
+            (on each side of the center for mode 'center')
+        mode (str): Where near-zero values sit in the colormap: 'center' for
+            diverging data, 'low' or 'high' for sequential data
+    
+    Returns:
+        matplotlib.colors.LinearSegmentedColormap: Colormap with a white band
+    """
+    colors = _patched_lut(base_name, mode, white_threshold)
+    suffix = 'center' if mode == 'center' else 'low'
+    return mcolors.LinearSegmentedColormap.from_list(f'{base_name}_white_{suffix}', colors)
+
+# Projected basemap geometries, keyed by (projection WKT, feature name)
+_FEATURE_CACHE = {}
+
+# Function to add coastlines, borders, land and ocean to a map
+def add_basemap(ax, projection, detail='high'):
+    """
+    Add coastlines, country borders, land and ocean to a map axes.
+    
+    The Natural Earth geometries are projected once per projection and cached,
+    so later maps only draw the already-projected paths.
+    
+    Parameters:
+        ax (cartopy.mpl.geoaxes.GeoAxes): Axes to draw on
+        projection (cartopy.crs.Projection): Projection of the axes
+        detail (str, optional): 'high' draws all features; 'low' (for drafts)
+            skips the borders and colors the ocean through the axes background
+            instead of loading the ocean polygons
+    """
+    # (name, feature, styling) in drawing order
+    features = [
+        ('coastline', cfeature.COASTLINE, {'facecolor': 'none', 'edgecolor': '#333333', 'linewidth': 1.0}),
+        ('borders', cfeature.BORDERS, {'linestyle': '-', 'edgecolor': '#777777', 'linewidth': 0.5}),
+        ('land', cfeature.LAND, {'facecolor': '#EFEFEF', 'alpha': 0.5}),
+        ('ocean', cfeature.OCEAN, {'facecolor': '#EAEAFF', 'alpha': 0.5})
+    ]
+    if detail == 'low':
+        ax.set_facecolor(mcolors.to_rgba('#EAEAFF', 0.5))
+        features = [feature for feature in features if feature[0] not in ('borders', 'ocean')]
+    elif detail != 'high':
+        raise ValueError(f"Unknown basemap detail: {detail}")
+    
+    proj_key = projection.to_wkt()
+    for name, feature, style in features:
+        key = (proj_key, name)
+        if key not in _FEATURE_CACHE:
+            _FEATURE_CACHE[key] = [
+                projection.project_geometry(geom, feature.crs)
+                for geom in feature.geometries()
+            ]
+        
+        # The geometries are already in the axes projection, so cartopy
+        # draws them without transforming them again
+        ax.add_geometries(_FEATURE_CACHE[key], crs=projection, **{**feature.kwargs, **style})
+
+# Function to get the cell-edge extent of a regular lat/lon grid
+def regular_grid_extent(lon, lat):
+    """
+    Get the image extent of a grid with uniformly spaced, increasing longitudes
+    and uniformly spaced latitudes.
+    
+    Parameters:
+        lon (numpy.ndarray): Longitude cell centers
+        lat (numpy.ndarray): Latitude cell centers
+    
+    Returns:
+        tuple or None: (left, right, bottom, top) cell edges, or None if the
+            grid is not regular
+    """
+    if len(lon) < 2 or len(lat) < 2:
+        return None
+    
+    dlon = np.diff(lon)
+    dlat = np.diff(lat)
+    if dlon[0] <= 0 or not (np.allclose(dlon, dlon[0], rtol=1e-3) and
+                            np.allclose(dlat, dlat[0], rtol=1e-3)):
+        return None
+    
+    dx = (lon[-1] - lon[0]) / (len(lon) - 1)
+    dy = abs(lat[-1] - lat[0]) / (len(lat) - 1)
+    return (lon[0] - dx / 2, lon[-1] + dx / 2,
+            min(lat[0], lat[-1]) - dy / 2, max(lat[0], lat[-1]) + dy / 2)
+
+# Function to reduce a grid to at most the available pixel width
+def coarsen_to_pixels(data, width_px):
+    """
+    Block-average a lat/lon grid that has more longitude points than the
+    pixels available to draw it.
+    
+    Parameters:
+        data (xarray.DataArray): Data with 'lat' and 'lon' dimensions
+        width_px (float): Width of the map in pixels
+    
+    Returns:
+        xarray.DataArray: The data, coarsened by an integer factor if needed
+    """
+    stride = max(1, data.sizes['lon'] // max(1, int(width_px)))
+    if stride == 1:
+        return data
+    return data.coarsen(lat=stride, lon=stride, boundary='trim').mean()
+
+# Function to draw gridded data on a map axes
+def plot_map_data(ax, data, cmap, norm, alpha=0.8, backend='matplotlib', dpi=None):
+    """
+    Draw a lat/lon grid on a map axes with the given colormap and norm.
+    
+    Parameters:
+        ax (cartopy.mpl.geoaxes.GeoAxes): Axes to draw on
+        data (xarray.DataArray): Data with 'lat' and 'lon' coordinates
+        cmap (matplotlib.colors.Colormap): Colormap to use
+        norm (matplotlib.colors.Normalize): Norm mapping data values to the colormap
+        alpha (float, optional): Opacity of the data layer
+        backend (str, optional): 'matplotlib' draws one quad per grid cell with
+            pcolormesh, or draws regular grids as a single image with imshow;
+            'datashader' rasterizes the grid with datashader and draws
+            it as a single image (falls back to 'matplotlib' if datashader is
+            not installed or the grid is irregular)
+        dpi (int, optional): Resolution the figure will be saved at, which caps the
+            datashader raster size (defaults to the figure's dpi)
+    
+    Returns:
+        matplotlib.cm.ScalarMappable: Artist to use for the colorbar
+    """
+    # Everything below zorder 0 (the data layer and the land/ocean fill) is
+    # flattened to a raster on save, while coastlines and text stay vector
+    ax.set_rasterization_zorder(0)
+    
+    # A contiguous float32 (lat, lon) array halves the bytes moved through the
+    # norm, colormap lookup and image resampling compared with float64
+    data = data.transpose('lat', 'lon')
+    data = data.copy(data=np.ascontiguousarray(data.values, dtype=np.float32))
+    
+    # Datashader needs ascending latitudes to rasterize into the right rows
+    if backend == 'datashader' and data.lat.values[-1] < data.lat.values[0]:
+        data = data.isel(lat=slice(None, None, -1))
+    
+    extent = regular_grid_extent(data.lon.values, data.lat.values)
+    
+    # Irregular grids are drawn by the matplotlib backend
+    if backend == 'datashader' and DATASHADER_AVAILABLE and extent is not None:
+        # Aggregate to at most the saved figure's pixel resolution
+        fig = ax.get_figure()
+        width_px, height_px = fig.get_size_inches() * (dpi or fig.dpi)
+        canvas = ds.Canvas(plot_width=int(min(data.sizes['lon'], width_px)),
+                           plot_height=int(min(data.sizes['lat'], height_px)),
+                           x_range=extent[:2], y_range=extent[2:])
+        agg = canvas.raster(data, interpolate='nearest')
+        
+        # Apply the norm up front so any matplotlib norm (e.g. TwoSlopeNorm)
+        # maps onto datashader's linear shading of the colormap
+        normalized = agg.copy(data=np.ma.filled(norm(agg.values), np.nan))
+        lut = [mcolors.to_hex(color) for color in cmap(np.linspace(0, 1, cmap.N))]
+        image = tf.shade(normalized, cmap=lut, how='linear', span=(0, 1))
+        
+        # The opacity is set on the artist rather than baked into the image,
+        # and the artist carries the norm and colormap, so a colorbar built
+        # from it matches the map exactly as with the matplotlib backend
+        im = ax.imshow(np.asarray(image.to_pil()), origin='upper', extent=extent,
+                       transform=ccrs.PlateCarree(), alpha=alpha, rasterized=True, zorder=-1)
+        im.set_cmap(cmap)
+        im.set_norm(norm)
+        return im
+    
+    if extent is not None:
+        # A regular grid is drawn as one image instead of one path per cell
+        return ax.imshow(
+            data.values,
+            extent=extent,
+            origin='lower' if data.lat.values[-1] > data.lat.values[0] else 'upper',
+            interpolation='nearest',
+            transform=ccrs.PlateCarree(),
+            cmap=cmap,
+            norm=norm,
+            alpha=alpha,
+            rasterized=True,
+            zorder=-1
+        )
+    
+    return ax.pcolormesh(
+        data.lon, data.lat, data.values, 
+        transform=ccrs.PlateCarree(),
+        cmap=cmap,
+        norm=norm,
+        alpha=alpha,
+        rasterized=True,
+        zorder=-1
+    )
+
 # Function to create a global map of solar potential change
+@cached_figure
 def create_solar_potential_map(data, title, filename, vmin=None, vmax=None, cmap='RdBu_r', 
-                              projection=ccrs.Robinson(), figsize=(12, 8)):
+                              projection=ccrs.Robinson(), figsize=(12, 8), backend='matplotlib',
+                              dpi=150, tight=False, detail='high'):
     """
     Create a publication-quality global map of solar potential change.
     
@@ -103,18 +582,24 @@ def create_solar_potential_map(data, title, filename, vmin=None, vmax=None, cmap
         cmap (str or colormap, optional): Colormap to use
         projection (cartopy.crs, optional): Map projection
         figsize (tuple, optional): Figure size
+        backend (str, optional): 'matplotlib' or 'datashader' (see plot_map_data)
+        dpi (int, optional): Resolution of the saved figure
+        tight (bool, optional): Crop the saved figure to its content with
+            bbox_inches='tight' (costs an extra render); otherwise the fixed
+            figure margins are used
+        detail (str, optional): Basemap detail, 'high' or 'low' (see add_basemap)
     """
-    fig = plt.figure(figsize=figsize, facecolor='white')
+    fig = _acquire_fig(figsize)
+    
+    # Fixed margins leave room for the title, colorbar and annotations
+    fig.subplots_adjust(left=0.03, right=0.97, top=0.92, bottom=0.06)
     ax = plt.axes(projection=projection)
     
     # Set global extent
     ax.set_global()
     
     # Add map features with improved styling
-    ax.coastlines(linewidth=1.0, color='#333333')
-    ax.add_feature(cfeature.BORDERS, linestyle='-', edgecolor='#777777', linewidth=0.5)
-    ax.add_feature(cfeature.LAND, facecolor='#EFEFEF', alpha=0.5)
-    ax.add_feature(cfeature.OCEAN, facecolor='#EAEAFF', alpha=0.5)
+    add_basemap(ax, projection, detail=detail)
     
     # Add gridlines for better geographic reference
     gl = ax.gridlines(draw_labels=False, linewidth=0.5, color='gray', alpha=0.5, linestyle='--')
@@ -127,26 +612,15 @@ def create_solar_potential_map(data, title, filename, vmin=None, vmax=None, cmap
         if vmax is None:
             vmax = max(abs(data.min().values), abs(data.max().values))
         
-        # Create a custom colormap with white at center
-        colors_rb = plt.cm.RdBu_r(np.linspace(0, 1, 256))
-        # Make values near zero white (center of the colormap)
-        white_threshold = 0.02  # 2% of the range
-        center_idx = 128  # Center of the colormap
-        threshold_idx = int(256 * white_threshold)
-        for i in range(center_idx - threshold_idx, center_idx + threshold_idx):
-            if i >= 0 and i < 256:  # Ensure index is valid
-                colors_rb[i] = [1, 1, 1, 1]  # White with full alpha
-        
-        custom_cmap = mcolors.LinearSegmentedColormap.from_list('RdBu_r_white_center', colors_rb)
+        # Create a custom colormap with white at center (values near zero)
+        custom_cmap = white_banded_cmap('RdBu_r', 0.02, 'center')
         
         # Create a centered norm for diverging data
         norm = mcolors.TwoSlopeNorm(vmin=vmin, vcenter=0, vmax=vmax)
         cmap = custom_cmap
         
-        # Add explanatory annotation for diverging data
-        plt.annotate('Red = Increased Solar Potential Loss, Blue = Decreased Solar Potential Loss, White = Near-Zero Change', 
-                    xy=(0.99, 0.01), xycoords='figure fraction', 
-                    fontsize=9, ha='right', va='bottom', style='italic', color='darkred')
+        # Explanatory annotation for diverging data
+        note = 'Red = Increased Solar Potential Loss, Blue = Decreased Solar Potential Loss, White = Near-Zero Change'
     else:
         # For sequential data (Reds_r for solar potential loss)
         if vmin is None:
@@ -155,36 +629,23 @@ def create_solar_potential_map(data, title, filename, vmin=None, vmax=None, cmap
             vmax = data.max().values
         
         # Create a custom colormap with white for near-zero values
-        colors_seq = plt.cm.get_cmap(cmap)(np.linspace(0, 1, 256))
-        # Make values near zero white (for sequential colormap, near-zero is at the end)
-        white_threshold = 0.05  # 5% of the range
-        threshold_idx = int(256 * white_threshold)
-        for i in range(256 - threshold_idx, 256):
-            colors_seq[i] = [1, 1, 1, 1]  # White with full alpha
-        
-        custom_cmap = mcolors.LinearSegmentedColormap.from_list(f'{cmap}_white_low', colors_seq)
+        # (for sequential colormap, near-zero is at the end)
+        custom_cmap = white_banded_cmap(cmap, 0.05, 'high')
         
         norm = mcolors.Normalize(vmin=vmin, vmax=vmax)
         cmap = custom_cmap
         
-        # Add explanatory annotation for sequential data
-        plt.annotate('Darker Red = Greater Solar Potential Loss, White = Near-Zero Values', 
-                    xy=(0.99, 0.01), xycoords='figure fraction', 
-                    fontsize=9, ha='right', va='bottom', style='italic', color='darkred')
+        # Explanatory annotation for sequential data
+        note = 'Darker Red = Greater Solar Potential Loss, White = Near-Zero Values'
     
     # Plot the data with slightly dimmed colors (alpha=0.8)
-    im = ax.pcolormesh(
-        data.lon, data.lat, data, 
-        transform=ccrs.PlateCarree(),
-        cmap=cmap,
-        norm=norm,
-        alpha=0.8,  # Dim the colors slightly
-        edgecolor='face',
-        linewidth=0.1
-    )
+    # Block-average grids finer than the saved figure can show
+    data = coarsen_to_pixels(data, figsize[0] * dpi)
+    
+    im = plot_map_data(ax, data, cmap, norm, alpha=0.8, backend=backend, dpi=dpi)
     
     # Add colorbar with improved styling
-    cbar = plt.colorbar(im, orientation='horizontal', pad=0.05, shrink=0.8)
+    cbar = plt.colorbar(im, ax=ax, orientation='horizontal', pad=0.05, shrink=0.8)
     cbar.set_label('Solar Potential Change (%)', fontweight='bold', fontsize=12)
     cbar.ax.tick_params(labelsize=10)
     
@@ -195,18 +656,19 @@ def create_solar_potential_map(data, title, filename, vmin=None, vmax=None, cmap
     # Add title with improved styling
     plt.title(title, fontweight='bold', pad=20, fontsize=14)
     
-    # Add data source annotation
-    plt.annotate('Data Source: CESM Climate Model', xy=(0.01, 0.01), xycoords='figure fraction', 
-                fontsize=9, ha='left', va='bottom', style='italic')
+    # Add data source and explanatory annotations
+    _add_standard_annotations(fig, note)
     
     # Save figure
-    plt.savefig(os.path.join(output_dir, filename), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, filename, dpi=dpi, bbox_inches='tight' if tight else None)
+    _release_fig(fig)
     print(f"Saved figure to {os.path.join(output_dir, filename)}")
 
 # Function to create a map of PM2.5 concentration
+@cached_figure
 def create_pm25_map(data, title, filename, vmin=None, vmax=None, cmap='YlOrBr', 
-                   projection=ccrs.Robinson(), figsize=(12, 8)):
+                   projection=ccrs.Robinson(), figsize=(12, 8), backend='matplotlib',
+                   dpi=150, tight=False, detail='high'):
     """
     Create a publication-quality global map of PM2.5 concentration.
     
@@ -219,18 +681,24 @@ def create_pm25_map(data, title, filename, vmin=None, vmax=None, cmap='YlOrBr',
         cmap (str or colormap, optional): Colormap to use
         projection (cartopy.crs, optional): Map projection
         figsize (tuple, optional): Figure size
+        backend (str, optional): 'matplotlib' or 'datashader' (see plot_map_data)
+        dpi (int, optional): Resolution of the saved figure
+        tight (bool, optional): Crop the saved figure to its content with
+            bbox_inches='tight' (costs an extra render); otherwise the fixed
+            figure margins are used
+        detail (str, optional): Basemap detail, 'high' or 'low' (see add_basemap)
     """
-    fig = plt.figure(figsize=figsize, facecolor='white')
+    fig = _acquire_fig(figsize)
+    
+    # Fixed margins leave room for the title, colorbar and annotations
+    fig.subplots_adjust(left=0.03, right=0.97, top=0.92, bottom=0.06)
     ax = plt.axes(projection=projection)
     
     # Set global extent
     ax.set_global()
     
     # Add map features with improved styling
-    ax.coastlines(linewidth=1.0, color='#333333')
-    ax.add_feature(cfeature.BORDERS, linestyle='-', edgecolor='#777777', linewidth=0.5)
-    ax.add_feature(cfeature.LAND, facecolor='#EFEFEF', alpha=0.5)
-    ax.add_feature(cfeature.OCEAN, facecolor='#EAEAFF', alpha=0.5)
+    add_basemap(ax, projection, detail=detail)
     
     # Add gridlines for better geographic reference
     gl = ax.gridlines(draw_labels=False, linewidth=0.5, color='gray', alpha=0.5, linestyle='--')
@@ -242,52 +710,80 @@ def create_pm25_map(data, title, filename, vmin=None, vmax=None, cmap='YlOrBr',
         vmax = data.max().values
     
     # Create a custom colormap with white for near-zero values
-    colors_seq = plt.cm.get_cmap(cmap)(np.linspace(0, 1, 256))
-    # Make values near zero white
-    white_threshold = 0.05  # 5% of the range
-    threshold_idx = int(256 * white_threshold)
-    for i in range(threshold_idx):
-        colors_seq[i] = [1, 1, 1, 1]  # White with full alpha
-    
-    custom_cmap = mcolors.LinearSegmentedColormap.from_list(f'{cmap}_white_low', colors_seq)
+    custom_cmap = white_banded_cmap(cmap, 0.05, 'low')
     cmap = custom_cmap
     
     # Create a norm for the colormap
     norm = mcolors.Normalize(vmin=vmin, vmax=vmax)
     
     # Plot the data with slightly dimmed colors (alpha=0.8)
-    im = ax.pcolormesh(
-        data.lon, data.lat, data, 
-        transform=ccrs.PlateCarree(),
-        cmap=cmap,
-        norm=norm,
-        alpha=0.8,  # Dim the colors slightly
-        edgecolor='face',
-        linewidth=0.1
-    )
+    # Block-average grids finer than the saved figure can show
+    data = coarsen_to_pixels(data, figsize[0] * dpi)
+    
+    im = plot_map_data(ax, data, cmap, norm, alpha=0.8, backend=backend, dpi=dpi)
     
     # Add colorbar with improved styling
-    cbar = plt.colorbar(im, orientation='horizontal', pad=0.05, shrink=0.8)
+    cbar = plt.colorbar(im, ax=ax, orientation='horizontal', pad=0.05, shrink=0.8)
     cbar.set_label('PM2.5 Concentration (μg/m³)', fontweight='bold', fontsize=12)
     cbar.ax.tick_params(labelsize=10)
     
     # Add title with improved styling
     plt.title(title, fontweight='bold', pad=20, fontsize=14)
     
-    # Add data source annotation
-    plt.annotate('Data Source: CESM Climate Model', xy=(0.01, 0.01), xycoords='figure fraction', 
-                fontsize=9, ha='left', va='bottom', style='italic')
-    
-    # Add explanatory annotation
-    plt.annotate('Higher values indicate greater wildfire PM2.5 pollution', 
-                xy=(0.99, 0.01), xycoords='figure fraction', 
-                fontsize=9, ha='right', va='bottom', style='italic', color='darkred')
+    # Add data source and explanatory annotations
+    _add_standard_annotations(fig, 'Higher values indicate greater wildfire PM2.5 pollution')
     
     # Save figure
-    plt.savefig(os.path.join(output_dir, filename), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, filename, dpi=dpi, bbox_inches='tight' if tight else None)
+    _release_fig(fig)
     print(f"Saved figure to {os.path.join(output_dir, filename)}")
 
+# Function to take a latitude-weighted mean of in-memory grids
+def _weighted_mean_np(arr, cos_lat):
+    """
+    Latitude-weighted mean over the last two (lat, lon) axes, ignoring NaNs.
+    
+    Parameters:
+        arr (numpy.ndarray): Array of shape (..., lat, lon)
+        cos_lat (numpy.ndarray): Weights of shape (lat,)
+    
+    Returns:
+        numpy.ndarray: Weighted means of shape (...)
+    """
+    # Reduce over longitude first, then apply the 1-D weights to the row totals,
+    # so no weight array of the full grid's size is ever built
+    weighted_sum = np.nansum(arr, axis=-1, dtype=np.float64) @ cos_lat
+    sum_of_weights = np.count_nonzero(~np.isnan(arr), axis=-1) @ cos_lat
+    
+    # Regions without valid cells get NaN, like xarray's weighted mean
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return weighted_sum / sum_of_weights
+
+# Kernel computing all regional means of stacked in-memory grids
+if NUMBA_AVAILABLE:
+    # Compiled loop over (region, dataset) pairs: NaN cells are skipped and add
+    # no weight. It is serial: a single pass over a few small regions is
+    # quicker than starting threads for it.
+    @numba.njit(cache=True)
+    def _regional_means_numba(stack, cos_lat, bounds):
+        n_regions = bounds.shape[0]
+        n_data = stack.shape[0]
+        out = np.empty((n_regions, n_data), dtype=np.float64)
+        for r in range(n_regions):
+            lat0, lat1, lon0, lon1 = bounds[r, 0], bounds[r, 1], bounds[r, 2], bounds[r, 3]
+            for d in range(n_data):
+                weighted_sum = 0.0
+                sum_of_weights = 0.0
+                for i in range(lat0, lat1):
+                    for j in range(lon0, lon1):
+                        value = stack[d, i, j]
+                        if value == value:
+                            weighted_sum += value * cos_lat[i]
+                            sum_of_weights += cos_lat[i]
+                # No valid cells (all NaN, or the region misses the grid)
+                out[r, d] = weighted_sum / sum_of_weights if sum_of_weights > 0 else np.nan
+        return out
+
 # Function to calculate regional means
 def calculate_regional_means(data_dict):
     """
@@ -299,41 +795,64 @@ def calculate_regional_means(data_dict):
     Returns:
         pandas.DataFrame: DataFrame of regional means
     """
-    regional_means = {}
+    # Stack all datasets along one dimension so each region takes a single reduction
+    stacked = xr.concat(list(data_dict.values()),
+                        dim=pd.Index(list(data_dict.keys()), name='scenario'))
+    stacked = stacked.transpose(..., 'lat', 'lon')
+    # searchsorted below needs ascending coordinates (e.g. not north-to-south
+    # latitudes); sorting copies the data, so it is only done when needed
+    if not all((np.diff(stacked[dim].values) > 0).all() for dim in ('lat', 'lon')):
+        stacked = stacked.sortby(['lat', 'lon'])
+    in_memory = isinstance(stacked.data, np.ndarray)
     
-    for region_name, region_bounds in regions.items():
-        regional_means[region_name] = {}
-        
-        for data_name, data in data_dict.items():
-            # Select region
-            region_data = data.sel(
-                lat=slice(region_bounds['lat_min'], region_bounds['lat_max']),
-                lon=slice(region_bounds['lon_min'], region_bounds['lon_max'])
-            )
-            
-            # Create weights based on grid cell area (proportional to cosine of latitude)
-            # This accounts for the fact that grid cells near the equator are larger than those near the poles
-            weights = np.cos(np.deg2rad(region_data.lat))
-            
-            # Use xarray's weighted mean functionality
-            # First create a DataArray of the same shape as region_data with the weights
-            # We need to broadcast the weights to match the shape of region_data
-            weight_factors = xr.ones_like(region_data) * weights
-            
-            # Calculate the weighted mean
-            weighted_sum = (region_data * weight_factors).sum(dim=['lat', 'lon'])
-            sum_of_weights = weight_factors.sum(dim=['lat', 'lon'])
-            weighted_mean = weighted_sum / sum_of_weights
+    # All datasets share one grid, so region bounds become integer indices once:
+    # (lat start, lat stop, lon start, lon stop) per region, inclusive of the
+    # bounds to match label-based slicing with .sel
+    lat_vals = stacked['lat'].values
+    lon_vals = stacked['lon'].values
+    bounds = np.array([
+        [np.searchsorted(lat_vals, region_bounds['lat_min'], side='left'),
+         np.searchsorted(lat_vals, region_bounds['lat_max'], side='right'),
+         np.searchsorted(lon_vals, region_bounds['lon_min'], side='left'),
+         np.searchsorted(lon_vals, region_bounds['lon_max'], side='right')]
+        for region_bounds in regions.values()
+    ], dtype=np.int64)
+    
+    # Create weights based on grid cell area (proportional to cosine of latitude)
+    # This accounts for the fact that grid cells near the equator are larger than those near the poles
+    cos_lat = np.cos(np.deg2rad(lat_vals))
+    
+    if in_memory and NUMBA_AVAILABLE:
+        # Every (region, dataset) pair in one compiled pass
+        means = _regional_means_numba(np.ascontiguousarray(stacked.values), cos_lat, bounds)
+        regional_means = dict(zip(regions, (pd.Series(row, index=stacked['scenario'].values)
+                                            for row in means)))
+    else:
+        regional_means = {}
+        for region_name, (lat0, lat1, lon0, lon1) in zip(regions, bounds):
+            weights = cos_lat[lat0:lat1]
             
-            # Store the mean
-            regional_means[region_name][data_name] = float(weighted_mean.values)
+            if in_memory:
+                # In-memory data skips xarray's weighted() bookkeeping
+                regional_means[region_name] = pd.Series(
+                    _weighted_mean_np(stacked.values[..., lat0:lat1, lon0:lon1], weights),
+                    index=stacked['scenario'].values
+                )
+            else:
+                # The 1-D weights are broadcast over longitude by xarray's weighted mean
+                region_data = stacked.isel(lat=slice(lat0, lat1), lon=slice(lon0, lon1))
+                weighted_mean = region_data.weighted(
+                    xr.DataArray(weights, dims='lat')
+                ).mean(dim=['lat', 'lon'])
+                regional_means[region_name] = weighted_mean.to_pandas()
     
-    # Convert to DataFrame
-    df = pd.DataFrame(regional_means)
+    # Convert to DataFrame (unnamed index, so chart legends carry no title)
+    df = pd.DataFrame(regional_means).rename_axis(None)
     
     return df
 
 # Function to create regional bar charts
+@cached_figure
 def create_regional_bar_chart(data_df, title, filename, figsize=(14, 8), color_palette='coolwarm_r'):
     """
     Create a publication-quality bar chart of regional means.
@@ -345,15 +864,28 @@ def create_regional_bar_chart(data_df, title, filename, figsize=(14, 8), color_p
         figsize (tuple, optional): Figure size
         color_palette (str, optional): Color palette to use
     """
-    fig, ax = plt.subplots(figsize=figsize, facecolor='white')
+    fig = _acquire_fig(figsize)
+    ax = fig.subplots()
     
     # Create a color palette - using coolwarm_r for better visual distinction
     # This creates a gradient from cool to warm colors
     reversed_palette = 'coolwarm'
     colors = sns.color_palette(reversed_palette, len(data_df))
     
-    # Plot the data with improved spacing
-    data_df.T.plot(kind='bar', ax=ax, color=colors, width=0.7, edgecolor='black', linewidth=0.5)
+    # Plot the data with improved spacing: one grouped bar per scenario in
+    # each region, the group spanning 0.7 of the region's slot
+    values = data_df.values.astype(np.float32)
+    positions = np.arange(data_df.shape[1])
+    bar_width = 0.7 / len(data_df)
+    for i, (scenario, row) in enumerate(zip(data_df.index, values)):
+        offset = (i - (len(data_df) - 1) / 2) * bar_width
+        ax.bar(positions + offset, row, width=bar_width, color=colors[i], label=scenario,
+               edgecolor='black', linewidth=0.5)
+        
+        # Add value labels on top of bars with improved formatting
+        ax.bar_label(ax.containers[-1], fmt='%.1f', fontsize=9, padding=3, fontweight='bold')
+    ax.set_xticks(positions, data_df.columns)
+    ax.set_xlim(-0.6, positions[-1] + 0.6)
     
     # Add title and labels with improved styling
     plt.title(title, fontweight='bold', pad=20, fontsize=16)
@@ -374,35 +906,24 @@ def create_regional_bar_chart(data_df, title, filename, figsize=(14, 8), color_p
     # Add horizontal line at y=0
     plt.axhline(y=0, color='black', linestyle='-', linewidth=0.8, alpha=0.7)
     
-    # Add value labels on top of bars with improved formatting
-    for container in ax.containers:
-        ax.bar_label(container, fmt='%.1f', fontsize=9, padding=3, fontweight='bold')
-    
-    # Add annotations
-    plt.annotate('Data Source: CESM Climate Model', xy=(0.01, 0.01), xycoords='figure fraction', 
-                fontsize=9, ha='left', va='bottom', style='italic')
-    
-    # Add explanatory annotation
+    # Add data source and explanatory annotations
     if "Changes" in title:
-        plt.annotate('Negative values indicate increased solar potential loss', 
-                    xy=(0.99, 0.01), xycoords='figure fraction', 
-                    fontsize=9, ha='right', va='bottom', style='italic', color='darkred')
+        _add_standard_annotations(fig, 'Negative values indicate increased solar potential loss')
     else:
-        plt.annotate('All values represent reduction in solar potential', 
-                    xy=(0.99, 0.01), xycoords='figure fraction', 
-                    fontsize=9, ha='right', va='bottom', style='italic', color='darkred')
+        _add_standard_annotations(fig, 'All values represent reduction in solar potential')
     
     # Adjust layout
     plt.tight_layout()
     
     # Save figure
-    plt.savefig(os.path.join(output_dir, filename), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, filename, dpi=300, bbox_inches='tight')
+    _release_fig(fig)
     print(f"Saved figure to {os.path.join(output_dir, filename)}")
 
 # Function to create a comparison figure of multiple scenarios
+@cached_figure
 def create_scenario_comparison_map(data_dict, title, filename, vmin=None, vmax=None, 
-                                  cmap='RdBu_r', figsize=(16, 12)):
+                                  cmap='RdBu_r', figsize=(16, 12), dpi=150, tight=False, detail='high'):
     """
     Create a multi-panel figure comparing different scenarios.
     
@@ -414,6 +935,11 @@ def create_scenario_comparison_map(data_dict, title, filename, vmin=None, vmax=N
         vmax (float, optional): Maximum value for colorbar
         cmap (str or colormap, optional): Colormap to use
         figsize (tuple, optional): Figure size
+        dpi (int, optional): Resolution of the saved figure
+        tight (bool, optional): Crop the saved figure to its content with
+            bbox_inches='tight' (costs an extra render); otherwise the fixed
+            figure margins are used
+        detail (str, optional): Basemap detail, 'high' or 'low' (see add_basemap)
     """
     # Determine the grid layout based on number of panels
     n_panels = len(data_dict)
@@ -424,12 +950,27 @@ def create_scenario_comparison_map(data_dict, title, filename, vmin=None, vmax=N
     else:
         n_rows, n_cols = 3, int(np.ceil(n_panels / 3))
     
-    fig = plt.figure(figsize=figsize, facecolor='white')
+    # All panels share one projection instance (and its transformers)
+    projection = ccrs.Robinson()
+    fig = _acquire_fig(figsize)
+    axes = fig.subplots(n_rows, n_cols, squeeze=False, subplot_kw={'projection': projection})
+    
+    # Remove the grid cells left over when the panels don't fill the last row
+    for ax in axes.flat[n_panels:]:
+        fig.delaxes(ax)
     
     # Find global min/max if not provided
     if vmin is None or vmax is None:
-        all_min = min([data.min().values for _, data in data_dict.items()])
-        all_max = max([data.max().values for _, data in data_dict.items()])
+        arrays = list(data_dict.values())
+        if all(isinstance(data.data, np.ndarray) for data in arrays):
+            # One reduction over all panels instead of one per panel
+            stacked = np.stack([data.values for data in arrays])
+            all_min, all_max = np.nanmin(stacked), np.nanmax(stacked)
+        else:
+            # Dask-backed panels: evaluate every min and max in a single compute
+            stacked = xr.concat(arrays, dim='panel', coords='minimal', compat='override')
+            extremes = xr.Dataset({'min': stacked.min(), 'max': stacked.max()}).compute()
+            all_min, all_max = extremes['min'].values, extremes['max'].values
         
         if cmap == 'RdBu_r' or cmap == 'RdBu':
             # For diverging data
@@ -443,58 +984,32 @@ def create_scenario_comparison_map(data_dict, title, filename, vmin=None, vmax=N
     
     # Create a custom colormap with white for near-zero values
     if cmap == 'RdBu_r' or cmap == 'RdBu':
-        # Create a custom colormap with white at center
-        colors_rb = plt.cm.RdBu_r(np.linspace(0, 1, 256))
-        # Make values near zero white (center of the colormap)
-        white_threshold = 0.02  # 2% of the range
-        center_idx = 128  # Center of the colormap
-        threshold_idx = int(256 * white_threshold)
-        for i in range(center_idx - threshold_idx, center_idx + threshold_idx):
-            if i >= 0 and i < 256:  # Ensure index is valid
-                colors_rb[i] = [1, 1, 1, 1]  # White with full alpha
-        
-        custom_cmap = mcolors.LinearSegmentedColormap.from_list('RdBu_r_white_center', colors_rb)
+        # Create a custom colormap with white at center (values near zero)
+        custom_cmap = white_banded_cmap('RdBu_r', 0.02, 'center')
         cmap = custom_cmap
         norm = mcolors.TwoSlopeNorm(vmin=vmin, vcenter=0, vmax=vmax)
     else:
         # Create a custom colormap with white for near-zero values
-        colors_seq = plt.cm.get_cmap(cmap)(np.linspace(0, 1, 256))
-        # Make values near zero white (for sequential colormap, near-zero is at the end)
-        white_threshold = 0.05  # 5% of the range
-        threshold_idx = int(256 * white_threshold)
-        for i in range(256 - threshold_idx, 256):
-            colors_seq[i] = [1, 1, 1, 1]  # White with full alpha
-        
-        custom_cmap = mcolors.LinearSegmentedColormap.from_list(f'{cmap}_white_low', colors_seq)
+        # (for sequential colormap, near-zero is at the end)
+        custom_cmap = white_banded_cmap(cmap, 0.05, 'high')
         cmap = custom_cmap
         norm = mcolors.Normalize(vmin=vmin, vmax=vmax)
     
     # Create each panel
-    for i, (panel_title, data) in enumerate(data_dict.items()):
-        ax = fig.add_subplot(n_rows, n_cols, i+1, projection=ccrs.Robinson())
+    for ax, (panel_title, data) in zip(axes.flat, data_dict.items()):
         
         # Set global extent
         ax.set_global()
         
         # Add map features with improved styling
-        ax.coastlines(linewidth=1.0, color='#333333')
-        ax.add_feature(cfeature.BORDERS, linestyle='-', edgecolor='#777777', linewidth=0.5)
-        ax.add_feature(cfeature.LAND, facecolor='#EFEFEF', alpha=0.5)
-        ax.add_feature(cfeature.OCEAN, facecolor='#EAEAFF', alpha=0.5)
+        add_basemap(ax, projection, detail=detail)
         
         # Add gridlines for better geographic reference
         gl = ax.gridlines(draw_labels=False, linewidth=0.5, color='gray', alpha=0.5, linestyle='--')
         
         # Plot the data with slightly dimmed colors (alpha=0.8)
-        im = ax.pcolormesh(
-            data.lon, data.lat, data, 
-            transform=ccrs.PlateCarree(),
-            cmap=cmap,
-            norm=norm,
-            alpha=0.8,  # Dim the colors slightly
-            edgecolor='face',
-            linewidth=0.1
-        )
+        data = coarsen_to_pixels(data, figsize[0] * dpi / n_cols)
+        im = plot_map_data(ax, data, cmap, norm, alpha=0.8, dpi=dpi)
         
         # Add panel title with improved styling
         ax.set_title(panel_title, fontweight='bold', fontsize=12)
@@ -512,26 +1027,18 @@ def create_scenario_comparison_map(data_dict, title, filename, vmin=None, vmax=N
     # Add main title with improved styling
     fig.suptitle(title, fontweight='bold', fontsize=16, y=0.98)
     
-    # Add annotations
-    plt.annotate('Data Source: CESM Climate Model', xy=(0.01, 0.01), xycoords='figure fraction', 
-                fontsize=9, ha='left', va='bottom', style='italic')
-    
-    # Add explanatory annotation
+    # Add data source and explanatory annotations
     if cmap == 'RdBu_r' or cmap == 'RdBu':
-        plt.annotate('Red = Increased Solar Potential Loss, Blue = Decreased Solar Potential Loss', 
-                    xy=(0.99, 0.01), xycoords='figure fraction', 
-                    fontsize=9, ha='right', va='bottom', style='italic', color='darkred')
+        _add_standard_annotations(fig, 'Red = Increased Solar Potential Loss, Blue = Decreased Solar Potential Loss')
     else:
-        plt.annotate('Darker Red = Greater Solar Potential Loss due to Wildfire PM2.5', 
-                    xy=(0.99, 0.01), xycoords='figure fraction', 
-                    fontsize=9, ha='right', va='bottom', style='italic', color='darkred')
+        _add_standard_annotations(fig, 'Darker Red = Greater Solar Potential Loss due to Wildfire PM2.5')
     
     # Adjust layout
     plt.subplots_adjust(top=0.9, bottom=0.15, wspace=0.05, hspace=0.1)
     
     # Save figure
-    plt.savefig(os.path.join(output_dir, filename), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, filename, dpi=dpi, bbox_inches='tight' if tight else None)
+    _release_fig(fig)
     print(f"Saved figure to {os.path.join(output_dir, filename)}")
 
 # Function to set output directory